@@ -0,0 +1,12 @@
+"""
+Translation Bridge v4 - Python version compatibility helpers.
+"""
+
+import sys
+from typing import Any, Dict
+
+
+# Keyword arguments for @dataclass: slots=True drops the per-instance __dict__
+# of classes created in bulk (tokens, parsed elements), but needs Python 3.10;
+# on 3.9 the dataclasses keep a __dict__.
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
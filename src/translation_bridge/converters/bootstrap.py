@@ -5,7 +5,7 @@ Converts Elementor JSON (and other page builder formats) to clean Bootstrap 5 HT
 Preserves styling, typography, flexbox layouts, and responsive settings.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from html import escape
 
 
@@ -104,6 +104,8 @@ class BootstrapConverter:
         self.include_metadata = include_metadata
         self.indent_level = 0
         self.indent_str = "  "
+        # Observer called with each widget as it is converted (see convert_fragment).
+        self._widget_hook: Optional[Callable[[Dict[str, Any]], None]] = None
 
     def convert(self, data: Any) -> str:
         """
@@ -198,12 +200,18 @@ class BootstrapConverter:
 
         return "\n".join(html_parts)
 
-    def convert_fragment(self, data: Any) -> str:
+    def convert_fragment(
+        self,
+        data: Any,
+        widget_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> str:
         """
         Convert Elementor JSON to Bootstrap HTML fragment (no doctype/head).
 
         Args:
             data: Elementor JSON data
+            widget_hook: Optional callable invoked with every widget element,
+                in document order, as it is converted
 
         Returns:
             Bootstrap HTML fragment string
@@ -215,9 +223,13 @@ class BootstrapConverter:
         else:
             return ""
 
-        html_parts = []
-        for element in elements:
-            html_parts.append(self._convert_element(element))
+        self._widget_hook = widget_hook
+        try:
+            html_parts = []
+            for element in elements:
+                html_parts.append(self._convert_element(element))
+        finally:
+            self._widget_hook = None
 
         return "\n".join(html_parts)
 
@@ -414,6 +426,8 @@ class BootstrapConverter:
 
     def _convert_widget(self, element: Dict[str, Any], depth: int = 0) -> str:
         """Convert a widget to Bootstrap HTML."""
+        if self._widget_hook is not None:
+            self._widget_hook(element)
         widget_type = element.get("widgetType", "")
 
         # Look up converter method
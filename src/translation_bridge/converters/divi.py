@@ -6,7 +6,10 @@ Generates proper shortcode structure: [et_pb_section][et_pb_row][et_pb_column][e
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from html import escape
 
 
@@ -20,6 +23,72 @@ TARGET_CMS_VERSION: str = "4.27.0"
 # detect via is_divi5_payload() and passthrough DIVI 5 content untouched.
 _DIVI5_BLOCK_PATTERN = re.compile(r"<!--\s*/?wp:divi/")
 
+# Structural elTypes: section-level wrappers, and those plus columns.
+_SECTION_TAGS = frozenset(("section", "container"))
+_STRUCTURAL_TAGS = _SECTION_TAGS | {"column"}
+
+# Shared read-only attrs for the common section with no attributes.
+_EMPTY_ATTRS: Mapping[str, str] = MappingProxyType({})
+
+# Column width thresholds (percent) and the DIVI column type for each band.
+# Widths below the smallest threshold fall back to a full-width column.
+_COL_THRESH = (25, 33, 50, 66, 75, 100)
+_COL_LABEL = ("4_4", "1_4", "1_3", "1_2", "2_3", "3_4", "4_4")
+
+# DIVI uses its own icon font; this is a simplified FontAwesome mapping.
+_DIVI_DEFAULT_ICON = "&#xe087;"
+_FA_ICON_GLYPHS = {
+    "fa-star": "&#xe087;",
+    "fa-check": "&#xe073;",
+    "fa-heart": "&#xe089;",
+    "fa-phone": "&#xe090;",
+    "fa-envelope": "&#xe076;",
+    "fa-user": "&#xe08a;",
+    "fa-home": "&#xe074;",
+}
+
+# Every spelling of a mapped icon (bare, FA5 "fas", FA6 "fa-solid", legacy
+# "fa") resolves with a single dict probe.
+_FA_TO_DIVI: Dict[str, str] = {
+    f"{prefix}{name}": glyph
+    for name, glyph in _FA_ICON_GLYPHS.items()
+    for prefix in ("", "fas ", "fa-solid ", "fa ")
+}
+
+
+# Characters html.escape() rewrites, matched in one regex scan. Attribute
+# values rarely contain any, so the common case is a single search miss
+# instead of five str.replace() passes.
+_ATTR_ESCAPE_RE = re.compile(r"[&<>\"']")
+_ATTR_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+
+
+def _escape_attr(value: str) -> str:
+    """Escape a shortcode attribute value exactly as html.escape() would."""
+    if _ATTR_ESCAPE_RE.search(value) is None:
+        return value
+    return _ATTR_ESCAPE_RE.sub(lambda m: _ATTR_ESCAPES[m.group()], value)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Return ``value`` if it is a dict, else an empty one."""
+    return value if isinstance(value, dict) else {}
+
+
+@lru_cache(maxsize=128)
+def _fa_to_divi_icon(fa_class: str) -> str:
+    """Resolve a FontAwesome class string to a DIVI icon glyph."""
+    glyph = _FA_TO_DIVI.get(fa_class)
+    if glyph is not None:
+        return glyph
+    # Unlisted spellings ("far fa-star", "fa-solid fa-star fa-lg"): match on
+    # the first icon-name token.
+    for token in fa_class.split():
+        glyph = _FA_ICON_GLYPHS.get(token)
+        if glyph is not None:
+            return glyph
+    return _DIVI_DEFAULT_ICON
+
 
 def is_divi5_payload(content: Any) -> bool:
     """Detect DIVI 5 ("block-based engine") content. See module-level note."""
@@ -85,8 +154,69 @@ class DiviConverter:
         "social-icons": "et_pb_social_media_follow",
     }
 
+    # Snapshot of the MODULE_TYPE_MAP keys for get_supported_types().
+    _SUPPORTED_TYPES = tuple(MODULE_TYPE_MAP)
+
+    # DIVI module to builder method. Resolved to bound methods once per
+    # instance so each widget costs a single dict probe.
+    MODULE_BUILDERS = {
+        "et_pb_text": "_build_text_module",
+        "et_pb_image": "_build_image_module",
+        "et_pb_button": "_build_button_module",
+        "et_pb_blurb": "_build_blurb_module",
+        "et_pb_number_counter": "_build_counter_module",
+        "et_pb_testimonial": "_build_testimonial_module",
+        "et_pb_tabs": "_build_tabs_module",
+        "et_pb_accordion": "_build_accordion_module",
+        "et_pb_video": "_build_video_module",
+        "et_pb_gallery": "_build_gallery_module",
+        "et_pb_cta": "_build_cta_module",
+        "et_pb_code": "_build_code_module",
+        "et_pb_divider": "_build_divider_module",
+        "et_pb_audio": "_build_audio_module",
+        "et_pb_pricing_tables": "_build_pricing_module",
+        "et_pb_countdown_timer": "_build_countdown_module",
+        "et_pb_map": "_build_map_module",
+        "et_pb_social_media_follow": "_build_social_module",
+    }
+
+    # Universal types rendered by a dedicated builder rather than the one
+    # their DIVI module would select.
+    _TYPE_BUILDERS = {
+        "icon-list": "_build_list_module",
+        "alert": "_build_alert_module",
+    }
+
+    # Builders that also receive the component's raw content.
+    _CONTENT_MODULES = frozenset(("et_pb_text", "et_pb_code"))
+
+    # Fixed section > row > column scaffolds used to wrap orphan modules and
+    # columns; kept as literals so the wrappers are plain concatenations.
+    _WRAP_PRE = '[et_pb_section]\n[et_pb_row]\n[et_pb_column type="4_4"]\n'
+    _WRAP_POST = "\n[/et_pb_column]\n[/et_pb_row]\n[/et_pb_section]"
+    _WRAP_COL_PRE = "[et_pb_section]\n[et_pb_row]\n"
+    _WRAP_COL_POST = "\n[/et_pb_row]\n[/et_pb_section]"
+
     def __init__(self):
         self._module_counter = 0
+        self._builders = self._resolve_builders()
+
+    def _resolve_builders(self) -> Dict[str, Tuple[Callable[..., str], bool]]:
+        """Map each universal type straight to its (builder, takes_content) pair.
+
+        Folding MODULE_TYPE_MAP into MODULE_BUILDERS up front means a widget
+        needs one dict probe to reach its builder instead of two.
+        """
+        builders = {}
+        for comp_type, module_type in self.MODULE_TYPE_MAP.items():
+            if comp_type in self._TYPE_BUILDERS:
+                builders[comp_type] = (getattr(self, self._TYPE_BUILDERS[comp_type]), False)
+            elif module_type in self.MODULE_BUILDERS:
+                builders[comp_type] = (
+                    getattr(self, self.MODULE_BUILDERS[module_type]),
+                    module_type in self._CONTENT_MODULES,
+                )
+        return builders
 
     def convert(self, data: Any) -> str:
         """
@@ -124,7 +254,7 @@ class DiviConverter:
         for element in elements:
             el_type = element.get("elType", "")
 
-            if el_type == "section" or el_type == "container":
+            if el_type in _SECTION_TAGS:
                 sections.append(self._convert_section(element))
             elif el_type == "column":
                 # Wrap orphan column in section/row
@@ -159,7 +289,7 @@ class DiviConverter:
             if el_type == "column":
                 col = self._convert_column(child)
                 rows_content.append(f'[et_pb_row]{col}[/et_pb_row]')
-            elif el_type in ("section", "container"):
+            elif el_type in _SECTION_TAGS:
                 grand_children = child.get("elements", [])
                 if any(g.get("elType") == "column" for g in grand_children if isinstance(g, dict)):
                     rows_content.append(self._convert_row_from_columns(grand_children))
@@ -191,7 +321,7 @@ class DiviConverter:
         el_type = child.get("elType", "")
         if el_type == "widget":
             return self._convert_widget(child)
-        if el_type in ("section", "container", "column"):
+        if el_type in _STRUCTURAL_TAGS:
             return "\n".join(
                 self._convert_child_to_module(g)
                 for g in child.get("elements", [])
@@ -201,12 +331,9 @@ class DiviConverter:
 
     def _convert_row_from_columns(self, columns: List[Dict[str, Any]]) -> str:
         """Convert columns to a DIVI row."""
-        cols_content = []
-        for col in columns:
-            if col.get("elType") == "column":
-                cols_content.append(self._convert_column(col))
-
-        inner = "\n".join(cols_content)
+        inner = "\n".join([
+            self._convert_column(col) for col in columns if col.get("elType") == "column"
+        ])
         return f'[et_pb_row]\n{inner}\n[/et_pb_row]'
 
     def _convert_column(self, column: Dict[str, Any]) -> str:
@@ -221,17 +348,9 @@ class DiviConverter:
         # Convert children. Nested structural elements (columns inside
         # columns, containers) flatten into this column so their leaf
         # content always survives.
-        modules = []
-        for child in children:
-            el_type = child.get("elType", "")
-            if el_type == "widget":
-                modules.append(self._convert_widget(child))
-            elif el_type in ("section", "container", "column"):
-                modules.append(self._convert_child_to_module(child))
-            else:
-                modules.append(self._convert_component(child))
+        modules = [self._convert_child_to_module(child) for child in children]
 
-        inner = "\n".join(m for m in modules if m)
+        inner = "\n".join([m for m in modules if m])
         return f'[et_pb_column type="{col_type}"]\n{inner}\n[/et_pb_column]'
 
     def _convert_widget(self, widget: Dict[str, Any]) -> str:
@@ -251,52 +370,15 @@ class DiviConverter:
 
     def _build_module(self, comp_type: str, settings: Dict[str, Any], content: str = "") -> str:
         """Build a DIVI module shortcode."""
-        module_type = self.MODULE_TYPE_MAP.get(comp_type, "")
-
-        if comp_type == "icon-list":
-            return self._build_list_module(settings)
-        if comp_type == "alert":
-            return self._build_alert_module(settings)
-        if module_type == "et_pb_text":
-            return self._build_text_module(settings, content)
-        elif module_type == "et_pb_image":
-            return self._build_image_module(settings)
-        elif module_type == "et_pb_button":
-            return self._build_button_module(settings)
-        elif module_type == "et_pb_blurb":
-            return self._build_blurb_module(settings)
-        elif module_type == "et_pb_number_counter":
-            return self._build_counter_module(settings)
-        elif module_type == "et_pb_testimonial":
-            return self._build_testimonial_module(settings)
-        elif module_type == "et_pb_tabs":
-            return self._build_tabs_module(settings)
-        elif module_type == "et_pb_accordion":
-            return self._build_accordion_module(settings)
-        elif module_type == "et_pb_video":
-            return self._build_video_module(settings)
-        elif module_type == "et_pb_gallery":
-            return self._build_gallery_module(settings)
-        elif module_type == "et_pb_cta":
-            return self._build_cta_module(settings)
-        elif module_type == "et_pb_code":
-            return self._build_code_module(settings, content)
-        elif module_type == "et_pb_divider":
-            return self._build_divider_module(settings)
-        elif module_type == "et_pb_audio":
-            return self._build_audio_module(settings)
-        elif module_type == "et_pb_pricing_tables":
-            return self._build_pricing_module(settings)
-        elif module_type == "et_pb_countdown_timer":
-            return self._build_countdown_module(settings)
-        elif module_type == "et_pb_map":
-            return self._build_map_module(settings)
-        elif module_type == "et_pb_social_media_follow":
-            return self._build_social_module(settings)
-        else:
+        entry = self._builders.get(comp_type)
+        if entry is None:
             # No native module — preserve every content-bearing setting in a
             # text module rather than dropping it.
             return self._build_fallback_module(settings, content)
+        builder, takes_content = entry
+        if takes_content:
+            return builder(settings, content)
+        return builder(settings)
 
     def _build_text_module(self, settings: Dict[str, Any], content: str = "") -> str:
         """Build et_pb_text module."""
@@ -308,19 +390,19 @@ class DiviConverter:
             text = f"<{tag}>{text}</{tag}>"
 
         attrs = {}
-        if settings.get("text_orientation"):
-            attrs["text_orientation"] = settings["text_orientation"]
-        if settings.get("align"):
-            attrs["text_orientation"] = settings["align"]
+        # An explicit DIVI orientation wins over a source builder's align.
+        orientation = settings.get("text_orientation") or settings.get("align")
+        if orientation:
+            attrs["text_orientation"] = orientation
 
         attrs_str = self._attrs_to_string(attrs)
         return f'[et_pb_text{attrs_str}]\n{text}\n[/et_pb_text]'
 
     def _build_image_module(self, settings: Dict[str, Any]) -> str:
         """Build et_pb_image module."""
-        image = settings.get("image", {})
-        url = image.get("url", "") if isinstance(image, dict) else ""
-        alt = image.get("alt", "") if isinstance(image, dict) else ""
+        image = _as_dict(settings.get("image"))
+        url = image.get("url", "")
+        alt = image.get("alt", "")
 
         attrs = {"src": url, "alt": alt}
 
@@ -333,8 +415,7 @@ class DiviConverter:
     def _build_button_module(self, settings: Dict[str, Any]) -> str:
         """Build et_pb_button module."""
         text = settings.get("text", "Click Here")
-        link = settings.get("link", {})
-        url = link.get("url", "#") if isinstance(link, dict) else "#"
+        url = _as_dict(settings.get("link")).get("url", "#")
 
         attrs = {
             "button_text": text,
@@ -352,8 +433,7 @@ class DiviConverter:
         title = settings.get("title_text", settings.get("title", ""))
         content = settings.get("description_text", "")
 
-        icon = settings.get("selected_icon", {})
-        icon_value = icon.get("value", "fas fa-star") if isinstance(icon, dict) else "fas fa-star"
+        icon_value = _as_dict(settings.get("selected_icon")).get("value", "fas fa-star")
 
         # Convert FontAwesome class to DIVI icon format
         divi_icon = self._fa_to_divi_icon(icon_value)
@@ -364,16 +444,15 @@ class DiviConverter:
             "font_icon": divi_icon,
         }
 
-        image = settings.get("image", {})
-        image_url = image.get("url", "") if isinstance(image, dict) else ""
+        image = _as_dict(settings.get("image"))
+        image_url = image.get("url", "")
         if image_url:
             attrs["image"] = image_url
             attrs["use_icon"] = "off"
             if image.get("alt"):
                 attrs["alt"] = image["alt"]
 
-        link = settings.get("link", {})
-        link_url = link.get("url", "") if isinstance(link, dict) else ""
+        link_url = _as_dict(settings.get("link")).get("url", "")
         if link_url:
             attrs["url"] = link_url
         link_text = settings.get("link_text", settings.get("button_text", ""))
@@ -401,8 +480,7 @@ class DiviConverter:
         content = settings.get("testimonial_content") or settings.get("blockquote_content") or settings.get("content", "")
         author = settings.get("testimonial_name") or settings.get("author") or settings.get("cite", "")
         job = settings.get("testimonial_job", "")
-        image = settings.get("testimonial_image", {})
-        portrait_url = image.get("url", "") if isinstance(image, dict) else ""
+        portrait_url = _as_dict(settings.get("testimonial_image")).get("url", "")
 
         attrs = {
             "author": author,
@@ -418,27 +496,23 @@ class DiviConverter:
         """Build et_pb_tabs module."""
         tabs = settings.get("tabs", [])
 
-        tab_items = []
-        for tab in tabs:
-            title = tab.get("tab_title", "Tab")
-            content = tab.get("tab_content", "")
-            tab_items.append(f'[et_pb_tab title="{escape(title)}"]\n{content}\n[/et_pb_tab]')
-
-        inner = "\n".join(tab_items)
+        inner = "\n".join([
+            f'[et_pb_tab title="{escape(tab.get("tab_title", "Tab"))}"]\n'
+            f'{tab.get("tab_content", "")}\n[/et_pb_tab]'
+            for tab in tabs
+        ])
         return f'[et_pb_tabs]\n{inner}\n[/et_pb_tabs]'
 
     def _build_accordion_module(self, settings: Dict[str, Any]) -> str:
         """Build et_pb_accordion module."""
         items = settings.get("tabs", [])
 
-        acc_items = []
-        for i, item in enumerate(items):
-            title = item.get("tab_title", f"Item {i+1}")
-            content = item.get("tab_content", "")
-            open_state = "on" if i == 0 else "off"
-            acc_items.append(f'[et_pb_accordion_item title="{escape(title)}" open="{open_state}"]\n{content}\n[/et_pb_accordion_item]')
-
-        inner = "\n".join(acc_items)
+        inner = "\n".join([
+            f'[et_pb_accordion_item title="{escape(item.get("tab_title", f"Item {i+1}"))}" '
+            f'open="{"on" if i == 0 else "off"}"]\n'
+            f'{item.get("tab_content", "")}\n[/et_pb_accordion_item]'
+            for i, item in enumerate(items)
+        ])
         return f'[et_pb_accordion]\n{inner}\n[/et_pb_accordion]'
 
     def _build_video_module(self, settings: Dict[str, Any]) -> str:
@@ -453,30 +527,28 @@ class DiviConverter:
         """Build et_pb_gallery module."""
         gallery = settings.get("gallery", settings.get("wp_gallery", []))
 
-        gallery_ids = []
-        for img in gallery:
-            if isinstance(img, dict) and img.get("id"):
-                gallery_ids.append(str(img["id"]))
-
-        attrs = {}
-        if gallery_ids:
-            attrs["gallery_ids"] = ",".join(gallery_ids)
-
-        attrs["fullwidth"] = "off"
-        columns = settings.get("columns", 3)
-        attrs["posts_number"] = str(columns)
-
         # Media-library ids only resolve on the source site; when the images
         # carry URLs, preserve them as markup so the gallery survives the
         # migration (ids alone render nothing on the target).
-        figures = "\n".join(
+        figures = "\n".join([
             f'<img src="{escape(str(img.get("url", "")))}" alt="{escape(str(img.get("alt", "")))}" />'
             for img in gallery
             if isinstance(img, dict) and img.get("url")
-        )
+        ])
         if figures:
             return f'[et_pb_code]\n{figures}\n[/et_pb_code]'
 
+        attrs = {}
+        gallery_ids = ",".join([
+            str(img["id"]) for img in gallery if isinstance(img, dict) and img.get("id")
+        ])
+        if gallery_ids:
+            attrs["gallery_ids"] = gallery_ids
+
+        attrs["fullwidth"] = "off"
+        columns = settings.get("columns", 3)
+        attrs["posts_number"] = str(columns)
+
         attrs_str = self._attrs_to_string(attrs)
         return f'[et_pb_gallery{attrs_str} /]'
 
@@ -485,8 +557,7 @@ class DiviConverter:
         title = settings.get("title", "")
         content = settings.get("description", "")
         button_text = settings.get("button_text", settings.get("button", "Click Here"))
-        link = settings.get("link", {})
-        url = link.get("url", "#") if isinstance(link, dict) else "#"
+        url = _as_dict(settings.get("link")).get("url", "#")
 
         attrs = {
             "title": title,
@@ -543,9 +614,8 @@ class DiviConverter:
         )
         button_text = settings.get("button_text", "")
         button_url = settings.get("button_url", "")
-        link = settings.get("link", {})
-        if not button_url and isinstance(link, dict):
-            button_url = link.get("url", "")
+        if not button_url:
+            button_url = _as_dict(settings.get("link")).get("url", "")
         attrs = {"title": title, "sum": f"{currency}{price}"}
         if button_text:
             attrs["button_text"] = button_text
@@ -607,80 +677,47 @@ class DiviConverter:
         """Build et_pb_divider module."""
         attrs = {"show_divider": "on"}
 
-        space = settings.get("space", {})
-        if isinstance(space, dict) and space.get("size"):
+        space = _as_dict(settings.get("space"))
+        if space.get("size"):
             attrs["divider_weight"] = f"{space['size']}{space.get('unit', 'px')}"
 
         attrs_str = self._attrs_to_string(attrs)
         return f'[et_pb_divider{attrs_str} /]'
 
-    def _build_section_attrs(self, settings: Dict[str, Any]) -> Dict[str, str]:
+    def _build_section_attrs(self, settings: Dict[str, Any]) -> Mapping[str, str]:
         """Build section attributes from settings."""
-        attrs = {}
-
         bg_color = settings.get("background_color", "")
-        if bg_color and not bg_color.startswith("globals"):
-            attrs["background_color"] = bg_color
+        if not bg_color or bg_color.startswith("globals"):
+            return _EMPTY_ATTRS
 
-        return attrs
+        return {"background_color": bg_color}
 
     def _wrap_in_section(self, module: str) -> str:
         """Wrap a module in section > row > column structure."""
-        return f'''[et_pb_section]
-[et_pb_row]
-[et_pb_column type="4_4"]
-{module}
-[/et_pb_column]
-[/et_pb_row]
-[/et_pb_section]'''
+        return self._WRAP_PRE + module + self._WRAP_POST
 
     def _wrap_column_in_section(self, column: Dict[str, Any]) -> str:
         """Wrap a column in section > row structure."""
         col = self._convert_column(column)
-        return f'''[et_pb_section]
-[et_pb_row]
-{col}
-[/et_pb_row]
-[/et_pb_section]'''
+        return self._WRAP_COL_PRE + col + self._WRAP_COL_POST
 
     def _size_to_divi_column(self, size: int) -> str:
         """Convert column size percentage to DIVI column type."""
-        if size >= 100:
-            return "4_4"
-        elif size >= 75:
-            return "3_4"
-        elif size >= 66:
-            return "2_3"
-        elif size >= 50:
-            return "1_2"
-        elif size >= 33:
-            return "1_3"
-        elif size >= 25:
-            return "1_4"
-        else:
-            return "4_4"
+        return _COL_LABEL[bisect_right(_COL_THRESH, size)]
 
     def _fa_to_divi_icon(self, fa_class: str) -> str:
         """Convert FontAwesome class to DIVI icon format."""
-        # DIVI uses a different icon format
-        # This is a simplified mapping
-        icon_map = {
-            "fas fa-star": "&#xe087;",
-            "fas fa-check": "&#xe073;",
-            "fas fa-heart": "&#xe089;",
-            "fas fa-phone": "&#xe090;",
-            "fas fa-envelope": "&#xe076;",
-            "fas fa-user": "&#xe08a;",
-            "fas fa-home": "&#xe074;",
-        }
-        return icon_map.get(fa_class, "&#xe087;")
+        if not isinstance(fa_class, str):
+            # SVG icons carry a {"url", "id"} dict rather than a class name.
+            return _DIVI_DEFAULT_ICON
+        return _fa_to_divi_icon(fa_class)
 
-    def _attrs_to_string(self, attrs: Dict[str, str]) -> str:
+    def _attrs_to_string(self, attrs: Mapping[str, str]) -> str:
         """Convert attributes dict to shortcode attribute string."""
         if not attrs:
             return ""
 
-        parts = [f' {key}="{escape(str(value))}"' for key, value in attrs.items() if value]
+        parts = [f' {key}="{_escape_attr(str(value))}"' for key, value in attrs.items() if value]
         return "".join(parts)
 
     def get_framework(self) -> str:
@@ -689,4 +726,4 @@ class DiviConverter:
 
     def get_supported_types(self) -> List[str]:
         """Return list of supported module types."""
-        return list(self.MODULE_TYPE_MAP.keys())
+        return list(self._SUPPORTED_TYPES)
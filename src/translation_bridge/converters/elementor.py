@@ -6,7 +6,9 @@ Generates proper section > column > widget structure with all required settings.
 """
 
 from typing import Any, Dict, List, Optional, Union
-import secrets
+import json
+import os
+import re
 from dataclasses import dataclass, field
 
 from translation_bridge.responsive import (
@@ -20,10 +22,24 @@ from translation_bridge.responsive import (
 # in 4.2 and planned for native support in 4.3.
 TARGET_CMS_VERSION: str = "3.30.0"
 
+# Random bytes fetched per refill of the element-ID pool (1024 IDs).
+_ID_POOL_BYTES = 4096
 
-@dataclass
+# Top-level elTypes that are already valid Elementor layout roots.
+_SECTION_TAGS = frozenset(("section", "container"))
+
+# Scalar size strings such as "16px", "1.5em" or "50%".
+_SIZE_RE = re.compile(r"^([\d.]+)(px|em|rem|%)?$")
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Return ``value`` if it is a dict, else an empty one."""
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(frozen=True)
 class ElementorSettings:
-    """Settings for Elementor conversion."""
+    """Settings for Elementor conversion. Immutable, so one default is shared."""
 
     include_responsive: bool = True
     include_hover_states: bool = True
@@ -71,9 +87,27 @@ class ElementorConverter:
         "html": "html",
     }
 
+    # Snapshot of the WIDGET_TYPE_MAP keys for get_supported_types().
+    _SUPPORTED_TYPES = tuple(WIDGET_TYPE_MAP)
+
+    _DEFAULT_SETTINGS = ElementorSettings()
+
+    # Shared encoder for convert(): built once instead of per json.dumps()
+    # call. Output is a freshly built tree, so the circular-reference scan
+    # is skipped; non-ASCII text is written as UTF-8 like the other
+    # serializers in this package.
+    _JSON_ENCODER = json.JSONEncoder(
+        indent=2,
+        separators=(",", ": "),
+        ensure_ascii=False,
+        check_circular=False,
+    )
+
     def __init__(self, settings: Optional[ElementorSettings] = None):
-        self.settings = settings or ElementorSettings()
+        self.settings = settings if settings is not None else self._DEFAULT_SETTINGS
         self._id_counter = 0
+        self._rand_pool = b""
+        self._rand_pos = 0
 
     def convert(self, data: Any) -> str:
         """
@@ -85,10 +119,8 @@ class ElementorConverter:
         Returns:
             Elementor JSON string
         """
-        import json
-
         elements = self._convert_to_elements(data)
-        return json.dumps(elements, indent=2)
+        return self._JSON_ENCODER.encode(elements)
 
     def convert_to_dict(self, data: Any) -> List[Dict[str, Any]]:
         """
@@ -117,12 +149,17 @@ class ElementorConverter:
             return [self._wrap_in_section(self._convert_component(data))]
 
         elif isinstance(data, list):
+            # Re-exported Elementor page: every root is already a layout
+            # element, so only IDs and responsive settings need filling in.
+            if data and all(isinstance(x, dict) and x.get("elType") in _SECTION_TAGS for x in data):
+                return [self._convert_element(x) for x in data]
+
             # List of components - wrap each in section/column
             sections = []
             for item in data:
                 if isinstance(item, dict):
-                    if item.get("elType") == "section":
-                        sections.append(item)
+                    if item.get("elType") in _SECTION_TAGS:
+                        sections.append(self._convert_element(item))
                     else:
                         widget = self._convert_component(item)
                         sections.append(self._wrap_in_section(widget))
@@ -135,24 +172,25 @@ class ElementorConverter:
         if "elType" in element:
             # Already Elementor format: ensure IDs and materialize any
             # canonical responsive data into _tablet/_mobile/_hover suffixes.
-            element = self._ensure_ids(element)
-            self._merge_responsive_settings(element)
+            self._finalize_element(element)
             return element
 
         # Convert to Elementor widget
         return self._convert_component(element)
 
-    def _merge_responsive_settings(self, element: Dict[str, Any]) -> None:
-        """Recursively emit canonical responsive data as suffixed settings."""
+    def _finalize_element(self, element: Dict[str, Any]) -> None:
+        """Recursively fill missing IDs and emit responsive data as suffixed settings."""
+        if not element.get("id"):
+            element["id"] = self._generate_id()
         responsive = element.pop("responsive", None)
-        canonical = responsive.get("styles") if isinstance(responsive, dict) else None
+        canonical = _as_dict(responsive).get("styles")
         if isinstance(canonical, dict):
             element.setdefault("settings", {}).update(
                 canonical_to_elementor_v3_settings(canonical)
             )
         for child in element.get("elements") or []:
             if isinstance(child, dict):
-                self._merge_responsive_settings(child)
+                self._finalize_element(child)
 
     def _convert_component(self, component: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a universal component to Elementor widget."""
@@ -297,8 +335,9 @@ class ElementorConverter:
             settings["_padding"] = self._create_spacing_value(attrs["padding"])
 
         # Alignment
-        if attrs.get("alignment") or attrs.get("align"):
-            settings["align"] = attrs.get("alignment", attrs.get("align"))
+        align = attrs.get("alignment") or attrs.get("align")
+        if align:
+            settings["align"] = align
 
         return settings
 
@@ -337,8 +376,7 @@ class ElementorConverter:
 
         # Parse string value like "16px"
         if isinstance(value, str):
-            import re
-            match = re.match(r"^([\d.]+)(px|em|rem|%)?$", value)
+            match = _SIZE_RE.match(value)
             if match:
                 return {
                     "size": float(match.group(1)),
@@ -368,19 +406,18 @@ class ElementorConverter:
             "isLinked": True,
         }
 
-    def _ensure_ids(self, element: Dict[str, Any]) -> Dict[str, Any]:
-        """Ensure all elements have IDs."""
-        if "id" not in element or not element["id"]:
-            element["id"] = self._generate_id()
-
-        if "elements" in element:
-            element["elements"] = [self._ensure_ids(el) for el in element["elements"]]
-
-        return element
-
     def _generate_id(self) -> str:
-        """Generate unique Elementor ID (8-char hex)."""
-        return secrets.token_hex(4)
+        """Generate unique Elementor ID (8-char hex).
+
+        IDs are sliced from a pooled ``os.urandom`` buffer so a large tree
+        costs one syscall per 1024 IDs instead of one per element.
+        """
+        if self._rand_pos >= len(self._rand_pool):
+            self._rand_pool = os.urandom(_ID_POOL_BYTES)
+            self._rand_pos = 0
+        i = self._rand_pos
+        self._rand_pos = i + 4
+        return self._rand_pool[i:i + 4].hex()
 
     def get_framework(self) -> str:
         """Return framework name."""
@@ -388,4 +425,4 @@ class ElementorConverter:
 
     def get_supported_types(self) -> List[str]:
         """Return list of supported widget types."""
-        return list(self.WIDGET_TYPE_MAP.keys())
+        return list(self._SUPPORTED_TYPES)
@@ -22,10 +22,13 @@ Canonical WP serialization rules preserved from v4.2.0:
 - core/separator carries `class="wp-block-separator has-alpha-channel-opacity"` (WP 6.5+).
 """
 
-from typing import Any, Dict, Iterable, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from html import escape
 import json
 import re
+import threading
 
 from ..interchange import component_to_element
 
@@ -33,6 +36,92 @@ from ..interchange import component_to_element
 # Upstream framework (WordPress core) version this converter is calibrated against.
 TARGET_CMS_VERSION: str = "6.9.0"
 
+# Static markup shared by every block of a kind.
+# `has-alpha-channel-opacity` is canonical on core/separator since WP 6.5.
+_SEPARATOR_HTML = '<hr class="wp-block-separator has-alpha-channel-opacity"/>'
+_SEPARATOR_BLOCK = f"<!-- wp:separator -->\n{_SEPARATOR_HTML}\n<!-- /wp:separator -->"
+_IMAGE_FIGURE = '<figure class="wp-block-image"><img src="%s" alt="%s"/>%s</figure>'
+_LIST_ITEM_OPEN = "<!-- wp:list-item -->\n<li>"
+_LIST_ITEM_CLOSE = "</li>\n<!-- /wp:list-item -->"
+_LIST_ITEM_SEP = _LIST_ITEM_CLOSE + "\n" + _LIST_ITEM_OPEN
+_GROUP_DIV = '<div class="wp-block-group">'
+_COLUMNS_DIV = '<div class="wp-block-columns">'
+_COLUMN_DIV = '<div class="wp-block-column">'
+_BUTTONS_DIV = '<div class="wp-block-buttons">'
+
+# Rendered widgets kept per converter instance; see _convert_widget.
+_WIDGET_CACHE_SIZE = 512
+
+# Compact serializer for block-comment attrs, configured once rather than on
+# every json.dumps() call.
+_ATTRS_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _list_html(texts: List[str]) -> str:
+    """Render raw item texts as core/list inner markup of core/list-item blocks.
+
+    Escaped items are stitched with one join against constant block
+    delimiters, rather than serializing each list-item block in turn.
+    """
+    items_html = ""
+    if texts:
+        items = _LIST_ITEM_SEP.join([escape(text) for text in texts])
+        items_html = _LIST_ITEM_OPEN + items + _LIST_ITEM_CLOSE
+    return '<ul class="wp-block-list">\n' + items_html + "\n</ul>"
+
+
+def _bare_block(name: str, html: str) -> str:
+    """Serialize a core block that has no attrs; ``name`` omits the ``core/`` namespace."""
+    return f"<!-- wp:{name} -->\n{html}\n<!-- /wp:{name} -->"
+
+
+def _is_column_row(children: List[Any]) -> bool:
+    """Return True when every dict child is a column.
+
+    Sections usually either start with a column or hold no columns at all,
+    so the first child settles most of them without building a generator.
+    """
+    first = children[0]
+    if isinstance(first, dict) and first.get("elType") != "column":
+        return False
+    return all(c.get("elType") == "column" for c in children if isinstance(c, dict))
+
+
+def _widget_cache_key(widget_type: str, settings: Any) -> Optional[Tuple[Any, ...]]:
+    """Return a hashable key for a widget with flat settings, else None.
+
+    Each value's class is part of the key so ``True`` and ``1`` (equal and
+    hash-equal, but serialized differently) never share an entry. Nested
+    settings (lists, dicts) are not cached.
+    """
+    if not isinstance(settings, dict):
+        return None
+    try:
+        key = (widget_type, tuple([(k, v.__class__, v) for k, v in sorted(settings.items())]))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@lru_cache(maxsize=1024)
+def _dump_scalar_attrs(items: Tuple[Tuple[str, Any], ...]) -> str:
+    return _ATTRS_ENCODER.encode(dict(items))
+
+
+def _dump_attrs(attrs: Dict[str, Any]) -> str:
+    """Serialize block attrs, memoizing the small flat dicts most blocks carry
+    (``{"level": 2}``, ``{"linkTo": "none"}``).
+
+    Only exact ``str``/``int`` values are cached: ``True``/``1``/``1.0`` hash
+    alike but serialize differently, and nested values are unhashable.
+    """
+    items = tuple(attrs.items())
+    for _, value in items:
+        if type(value) is not str and type(value) is not int:
+            return _ATTRS_ENCODER.encode(attrs)
+    return _dump_scalar_attrs(items)
+
 
 class GutenbergConverter:
     """Convert Elementor / universal data to Gutenberg block markup."""
@@ -97,8 +186,72 @@ class GutenbergConverter:
         "animated-headline",
     }
 
+    # widgetType -> builder method for SIMPLE_BLOCK_FOR_WIDGET entries, bound
+    # once per instance so each widget dispatches with one dict probe.
+    SIMPLE_WIDGET_BUILDERS: Dict[str, str] = {
+        "heading": "_build_heading_block",
+        "text-editor": "_build_paragraph_block",
+        "text": "_build_paragraph_block",
+        "paragraph": "_build_paragraph_block",
+        "image": "_build_image_block_from_settings",
+        "button": "_build_buttons_block_from_settings",
+        "divider": "_build_separator_block",
+        "spacer": "_build_spacer_block",
+        "icon": "_build_icon_html_block",
+        "html": "_build_html_block",
+        "shortcode": "_build_shortcode_block",
+        "audio": "_build_audio_block",
+        "video": "_build_video_block",
+        "icon-list": "_build_list_block",
+        "image-gallery": "_build_gallery_block",
+        "basic-gallery": "_build_gallery_block",
+        "gallery": "_build_gallery_block",
+        "blockquote": "_build_blockquote_block",
+        "social-icons": "_build_social_links_block",
+        "share-buttons": "_build_social_links_block",
+        "nav-menu": "_build_navigation_block",
+        "nav": "_build_navigation_block",
+    }
+
+    # Compound widgets expand into several blocks and take the whole component.
+    COMPOUND_WIDGET_BUILDERS: Dict[str, str] = {
+        "tabs": "_convert_tabs_or_accordion",
+        "accordion": "_convert_tabs_or_accordion",
+        "toggle": "_convert_tabs_or_accordion",
+        "icon-box": "_convert_card",
+        "image-box": "_convert_card",
+        "flip-box": "_convert_card",
+        "card": "_convert_card",
+        "call-to-action": "_convert_cta",
+        "counter": "_convert_counter",
+        "testimonial": "_convert_testimonial",
+        "price-table": "_convert_pricing_table",
+        "price-list": "_convert_pricing_table",
+        "alert": "_convert_alert",
+    }
+
+    # elType -> converter method; anything else goes through _convert_component.
+    ELEMENT_CONVERTERS: Dict[str, str] = {
+        "section": "_convert_section",
+        "container": "_convert_section",
+        "column": "_convert_column",
+        "widget": "_convert_widget",
+    }
+
     def __init__(self) -> None:
-        pass
+        self._simple_builders = {
+            widget_type: getattr(self, name)
+            for widget_type, name in self.SIMPLE_WIDGET_BUILDERS.items()
+        }
+        self._compound_builders = {
+            widget_type: getattr(self, name)
+            for widget_type, name in self.COMPOUND_WIDGET_BUILDERS.items()
+        }
+        self._element_converters = {
+            el_type: getattr(self, name) for el_type, name in self.ELEMENT_CONVERTERS.items()
+        }
+        self._widget_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        self._widget_cache_lock = threading.Lock()
 
     # ----- entry points -----
 
@@ -125,39 +278,31 @@ class GutenbergConverter:
         if isinstance(data, dict):
             if "elements" in data and isinstance(data["elements"], list):
                 return self._convert_elements(data["elements"])
-            el_type = data.get("elType")
-            if el_type in ("section", "container"):
-                return self._convert_section(data)
-            if el_type == "column":
-                return self._convert_column(data)
-            if el_type == "widget":
-                return self._convert_widget(data)
-            return self._convert_component(data)
+            convert = self._element_converters.get(data.get("elType"), self._convert_component)
+            return convert(data)
         if isinstance(data, list):
             return self._convert_elements(data)
         return ""
 
     def _convert_elements(self, elements: Iterable[Dict[str, Any]]) -> str:
-        blocks: List[str] = []
-        for element in elements:
-            if not isinstance(element, dict):
-                continue
-            el_type = element.get("elType")
-            if el_type in ("section", "container"):
-                blocks.append(self._convert_section(element))
-            elif el_type == "column":
-                blocks.append(self._convert_column(element))
-            elif el_type == "widget":
-                blocks.append(self._convert_widget(element))
-            else:
-                blocks.append(self._convert_component(element))
-        return "\n\n".join(b for b in blocks if b)
+        return "\n\n".join(self._convert_children(elements))
+
+    def _convert_children(self, elements: Iterable[Any]) -> List[str]:
+        """Convert each dict element by its elType, dropping empty results."""
+        converters = self._element_converters
+        fallback = self._convert_component
+        blocks = [
+            converters.get(element.get("elType"), fallback)(element)
+            for element in elements
+            if isinstance(element, dict)
+        ]
+        return [b for b in blocks if b]
 
     def _convert_section(self, section: Dict[str, Any]) -> str:
         settings = section.get("settings", {}) or {}
         children = section.get("elements", []) or []
 
-        if children and all(c.get("elType") == "column" for c in children if isinstance(c, dict)):
+        if children and _is_column_row(children):
             return self._build_columns_block(children, settings)
         return self._build_group_block(children, settings)
 
@@ -165,21 +310,7 @@ class GutenbergConverter:
         settings = column.get("settings", {}) or {}
         children = column.get("elements", []) or []
 
-        inner_blocks: List[str] = []
-        for child in children:
-            if not isinstance(child, dict):
-                continue
-            el_type = child.get("elType")
-            if el_type == "widget":
-                inner_blocks.append(self._convert_widget(child))
-            elif el_type in ("section", "container"):
-                inner_blocks.append(self._convert_section(child))
-            elif el_type == "column":
-                inner_blocks.append(self._convert_column(child))
-            else:
-                inner_blocks.append(self._convert_component(child))
-
-        inner_content = "\n".join(b for b in inner_blocks if b)
+        inner_blocks = self._convert_children(children)
 
         attrs = self._denormalize_settings(settings)
         col_size = settings.get("_column_size", 100)
@@ -191,27 +322,51 @@ class GutenbergConverter:
             # Canonical core/column width is a string with unit (e.g. "50%").
             attrs["width"] = f"{col_size_num}%"
 
-        html = f'<div class="wp-block-column">\n{inner_content}\n</div>'
-        return self._build_block("core/column", attrs, html)
+        return self._build_wrapper_block("core/column", attrs, _COLUMN_DIV, inner_blocks)
 
     def _convert_widget(self, widget: Dict[str, Any]) -> str:
         widget_type = widget.get("widgetType", "")
         settings = widget.get("settings", {}) or {}
-        children = widget.get("elements", []) or []
+        key = _widget_cache_key(widget_type, settings)
+        if key is None:
+            return self._render_widget(widget, widget_type, settings)
+
+        # Block markup depends only on the widget type and settings, so
+        # repeated widgets (separators, identical buttons) reuse it. The lock
+        # lets threads share one converter, as the registry transforms do.
+        cache = self._widget_cache
+        with self._widget_cache_lock:
+            html = cache.get(key)
+            if html is not None:
+                cache.move_to_end(key)
+                return html
+
+        html = self._render_widget(widget, widget_type, settings)
+        with self._widget_cache_lock:
+            cache[key] = html
+            cache.move_to_end(key)
+            while len(cache) > _WIDGET_CACHE_SIZE:
+                cache.popitem(last=False)
+        return html
+
+    def _render_widget(self, widget: Dict[str, Any], widget_type: str, settings: Dict[str, Any]) -> str:
         component = {
             "widgetType": widget_type,
             "settings": settings,
-            "children": children,
+            "children": widget.get("elements", []) or [],
             "elementor_id": widget.get("id"),
         }
 
-        if widget_type in self.COMPOUND_WIDGETS:
-            return self._convert_compound(component)
-        if widget_type in self.MARKER_WIDGETS:
-            return self._convert_as_marker(component)
-        if widget_type in self.SIMPLE_BLOCK_FOR_WIDGET:
-            return self._convert_simple_widget(component)
-        # Unknown widget type — preserve as a marker, never collapse to an empty paragraph.
+        # The simple, compound, and marker sets are disjoint, so the most common
+        # (simple) widgets resolve with a single dict probe.
+        builder = self._simple_builders.get(widget_type)
+        if builder is not None:
+            return builder(settings)
+        compound = self._compound_builders.get(widget_type)
+        if compound is not None:
+            return compound(component)
+        # Marker widgets and unknown types are both preserved as markers, never
+        # collapsed to an empty paragraph.
         return self._convert_as_marker(component)
 
     def _convert_component(self, component: Dict[str, Any]) -> str:
@@ -228,11 +383,11 @@ class GutenbergConverter:
         # Unmapped container-ish components: recurse into children inside a
         # group block (they must never hit the marker path or collapse).
         if component.get("type") == "unknown" and component.get("children"):
-            inner = "".join(
+            inner = "".join([
                 self._convert(child)
                 for child in component.get("children", [])
                 if isinstance(child, dict)
-            )
+            ])
             return (
                 "<!-- wp:group -->\n<div class=\"wp-block-group\">\n"
                 f"{inner}"
@@ -251,45 +406,6 @@ class GutenbergConverter:
 
     # ----- simple 1:1 widgets -----
 
-    def _convert_simple_widget(self, component: Dict[str, Any]) -> str:
-        widget_type = component["widgetType"]
-        settings = component["settings"]
-
-        if widget_type == "heading":
-            return self._build_heading_block(settings)
-        if widget_type in ("text-editor", "text", "paragraph"):
-            return self._build_paragraph_block(settings)
-        if widget_type == "image":
-            return self._build_image_block_from_settings(settings)
-        if widget_type == "button":
-            return self._build_buttons_block_from_settings(settings)
-        if widget_type == "divider":
-            return self._build_separator_block(settings)
-        if widget_type == "spacer":
-            return self._build_spacer_block(settings)
-        if widget_type == "icon":
-            return self._build_icon_html_block(settings)
-        if widget_type == "html":
-            return self._build_html_block(settings)
-        if widget_type == "shortcode":
-            return self._build_shortcode_block(settings)
-        if widget_type == "audio":
-            return self._build_audio_block(settings)
-        if widget_type == "video":
-            return self._build_video_block(settings)
-        if widget_type == "icon-list":
-            return self._build_list_block(settings)
-        if widget_type in ("image-gallery", "basic-gallery", "gallery"):
-            return self._build_gallery_block(settings)
-        if widget_type == "blockquote":
-            return self._build_blockquote_block(settings)
-        if widget_type in ("social-icons", "share-buttons"):
-            return self._build_social_links_block(settings)
-        if widget_type in ("nav-menu", "nav"):
-            return self._build_navigation_block(settings)
-
-        return self._convert_as_marker(component)
-
     def _build_heading_block(self, settings: Dict[str, Any]) -> str:
         title = settings.get("title", "")
         level = self._parse_heading_level(settings.get("header_size", "h2"))
@@ -305,7 +421,7 @@ class GutenbergConverter:
     def _build_paragraph_block(self, settings: Dict[str, Any], content: str = "") -> str:
         text = content or settings.get("editor", settings.get("text", ""))
         if self._should_preserve_rich_text_as_html_block(text):
-            return self._build_block("core/html", {}, str(text).strip())
+            return _bare_block("html", str(text).strip())
 
         attrs = self._denormalize_settings(settings)
         align = settings.get("align") or settings.get("text_align")
@@ -317,10 +433,12 @@ class GutenbergConverter:
         return self._build_block("core/paragraph", attrs, html)
 
     def _build_image_block_from_settings(self, settings: Dict[str, Any]) -> str:
-        image = settings.get("image") or {}
-        url = image.get("url", "") if isinstance(image, dict) else ""
-        alt = image.get("alt", "") if isinstance(image, dict) else ""
-        image_id = image.get("id") if isinstance(image, dict) else None
+        image = settings.get("image")
+        if not isinstance(image, dict):
+            image = {}
+        url = image.get("url", "")
+        alt = image.get("alt", "")
+        image_id = image.get("id")
         caption = settings.get("caption", "")
 
         attrs: Dict[str, Any] = {}
@@ -333,19 +451,18 @@ class GutenbergConverter:
             if caption
             else ""
         )
-        html = (
-            f'<figure class="wp-block-image">'
-            f'<img src="{escape(str(url))}" alt="{escape(str(alt))}"/>'
-            f"{caption_html}</figure>"
-        )
+        html = _IMAGE_FIGURE % (escape(str(url)), escape(str(alt)), caption_html)
         return self._build_block("core/image", attrs, html)
 
     def _build_buttons_block_from_settings(self, settings: Dict[str, Any]) -> str:
         text = settings.get("text", "Click Here")
-        link = settings.get("link") or {}
-        url = link.get("url", "#") if isinstance(link, dict) else "#"
-        target = "_blank" if (isinstance(link, dict) and link.get("is_external")) else ""
-        rel = "nofollow" if (isinstance(link, dict) and link.get("nofollow")) else ""
+        link = settings.get("link")
+        if isinstance(link, dict):
+            url = link.get("url", "#")
+            target = "_blank" if link.get("is_external") else ""
+            rel = "nofollow" if link.get("nofollow") else ""
+        else:
+            url, target, rel = "#", "", ""
 
         button_attrs: Dict[str, Any] = {}
         if url and url != "#":
@@ -365,16 +482,10 @@ class GutenbergConverter:
         )
         button_block = self._build_block("core/button", button_attrs, btn_inner)
 
-        wrapper = f'<div class="wp-block-buttons">\n{button_block}\n</div>'
-        return self._build_block("core/buttons", {}, wrapper)
+        return self._build_wrapper_block("core/buttons", {}, _BUTTONS_DIV, [button_block])
 
     def _build_separator_block(self, settings: Dict[str, Any]) -> str:
-        # `has-alpha-channel-opacity` is canonical since WP 6.5.
-        return self._build_block(
-            "core/separator",
-            {},
-            '<hr class="wp-block-separator has-alpha-channel-opacity"/>',
-        )
+        return _SEPARATOR_BLOCK
 
     def _build_spacer_block(self, settings: Dict[str, Any]) -> str:
         height = settings.get("space", {})
@@ -384,7 +495,7 @@ class GutenbergConverter:
             f'<div style="height:{escape(str(height_val))}" aria-hidden="true" '
             f'class="wp-block-spacer"></div>'
         )
-        return self._build_block("core/spacer", {}, html)
+        return _bare_block("spacer", html)
 
     def _build_icon_html_block(self, settings: Dict[str, Any]) -> str:
         selected = settings.get("selected_icon") or {}
@@ -397,15 +508,15 @@ class GutenbergConverter:
             if icon_class
             else ""
         )
-        return self._build_block("core/html", {}, html)
+        return _bare_block("html", html)
 
     def _build_html_block(self, settings: Dict[str, Any], content: str = "") -> str:
         html = content or settings.get("html", "")
-        return self._build_block("core/html", {}, html)
+        return _bare_block("html", html)
 
     def _build_shortcode_block(self, settings: Dict[str, Any]) -> str:
         shortcode = settings.get("shortcode", "")
-        return self._build_block("core/shortcode", {}, shortcode)
+        return _bare_block("shortcode", shortcode)
 
     def _build_audio_block(self, settings: Dict[str, Any]) -> str:
         link = settings.get("link") or settings.get("audio_url") or ""
@@ -441,19 +552,12 @@ class GutenbergConverter:
             except (ValueError, TypeError):
                 items = []
         # WP 6.0+ canonical shape: core/list contains core/list-item innerBlocks.
-        item_blocks: List[str] = []
-        for it in items if isinstance(items, list) else []:
-            if not isinstance(it, dict):
-                continue
-            text = it.get("text", "")
-            inner = f"<li>{escape(str(text))}</li>"
-            item_blocks.append(self._build_block("core/list-item", {}, inner))
-        html = (
-            '<ul class="wp-block-list">\n'
-            + "\n".join(item_blocks)
-            + "\n</ul>"
-        )
-        return self._build_block("core/list", {}, html)
+        texts = [
+            str(it.get("text", ""))
+            for it in (items if isinstance(items, list) else [])
+            if isinstance(it, dict)
+        ]
+        return _bare_block("list", _list_html(texts))
 
     def _build_gallery_block(self, settings: Dict[str, Any]) -> str:
         images = settings.get("wp_gallery") or settings.get("gallery") or settings.get("images") or []
@@ -463,26 +567,30 @@ class GutenbergConverter:
             except (ValueError, TypeError):
                 images = []
 
-        ids: List[int] = []
+        # Ordered set of attachment IDs. Exports often repeat an attachment;
+        # keep its first image only, so ids stays parallel to the figures.
+        ids: Dict[int, None] = {}
         figures: List[str] = []
         for img in images if isinstance(images, list) else []:
             if not isinstance(img, dict):
                 continue
-            url = img.get("url", "")
-            alt = img.get("alt", "")
             try:
-                if img.get("id"):
-                    ids.append(int(img["id"]))
+                image_id = int(img["id"]) if img.get("id") else None
             except (TypeError, ValueError):
-                pass
+                image_id = None
+            if image_id is not None:
+                if image_id in ids:
+                    continue
+                ids[image_id] = None
+            url = escape(str(img.get("url", "")))
+            alt = escape(str(img.get("alt", "")))
             figures.append(
-                f'<figure class="wp-block-image">'
-                f'<img src="{escape(str(url))}" alt="{escape(str(alt))}"/></figure>'
+                f'<figure class="wp-block-image"><img src="{url}" alt="{alt}"/></figure>'
             )
 
         attrs: Dict[str, Any] = {"linkTo": settings.get("link_to", "none")}
         if ids:
-            attrs["ids"] = ids
+            attrs["ids"] = list(ids)
         html = (
             f'<figure class="wp-block-gallery has-nested-images columns-default">\n'
             f'{"".join(figures)}\n</figure>'
@@ -495,7 +603,7 @@ class GutenbergConverter:
         rendered = body if self._looks_like_html(body) else f"<p>{escape(str(body))}</p>"
         cite_html = f"<cite>{escape(str(cite))}</cite>" if cite else ""
         html = f'<blockquote class="wp-block-quote">{rendered}{cite_html}</blockquote>'
-        return self._build_block("core/quote", {}, html)
+        return _bare_block("quote", html)
 
     def _build_social_links_block(self, settings: Dict[str, Any]) -> str:
         items = settings.get("social_icon_list") or settings.get("icons") or []
@@ -504,45 +612,25 @@ class GutenbergConverter:
                 items = json.loads(items)
             except (ValueError, TypeError):
                 items = []
-        inner = ""
+        links: List[str] = []
         for item in items if isinstance(items, list) else []:
             if not isinstance(item, dict):
                 continue
             link = item.get("link") or {}
             url = link.get("url", "") if isinstance(link, dict) else (link or "")
             service = item.get("social") or item.get("service") or "link"
-            attrs_json = json.dumps(
-                {"url": url, "service": service}, separators=(",", ":"), ensure_ascii=False
-            )
-            inner += f"<!-- wp:social-link {attrs_json} /-->"
-        html = f'<ul class="wp-block-social-links">{inner}</ul>'
-        return self._build_block("core/social-links", {}, html)
+            attrs_json = _dump_attrs({"url": url, "service": service})
+            links.append(f"<!-- wp:social-link {attrs_json} /-->")
+        html = f'<ul class="wp-block-social-links">{"".join(links)}</ul>'
+        return _bare_block("social-links", html)
 
     def _build_navigation_block(self, settings: Dict[str, Any]) -> str:
         # core/navigation requires a menu reference; without one, emit the empty block so
         # the editor prompts the user to pick a menu rather than dropping the widget.
-        return self._build_block("core/navigation", {}, "")
+        return _bare_block("navigation", "")
 
     # ----- compound widgets -----
 
-    def _convert_compound(self, component: Dict[str, Any]) -> str:
-        widget_type = component["widgetType"]
-        if widget_type in ("tabs", "accordion", "toggle"):
-            return self._convert_tabs_or_accordion(component)
-        if widget_type in ("icon-box", "image-box", "flip-box", "card"):
-            return self._convert_card(component)
-        if widget_type == "call-to-action":
-            return self._convert_cta(component)
-        if widget_type == "counter":
-            return self._convert_counter(component)
-        if widget_type == "testimonial":
-            return self._convert_testimonial(component)
-        if widget_type in ("price-table", "price-list"):
-            return self._convert_pricing_table(component)
-        if widget_type == "alert":
-            return self._convert_alert(component)
-        return self._convert_as_marker(component)
-
     def _convert_tabs_or_accordion(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
         widget_type = component["widgetType"]
@@ -565,7 +653,7 @@ class GutenbergConverter:
         class_name = (
             "devtb-accordion-converted" if widget_type in ("accordion", "toggle") else "devtb-tabs-converted"
         )
-        return self._wrap_in_group("\n".join(blocks), {"className": class_name})
+        return self._wrap_in_group(blocks, {"className": class_name})
 
     def _convert_card(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -594,7 +682,7 @@ class GutenbergConverter:
                 )
             )
 
-        return self._wrap_in_group("\n".join(blocks), {"className": "devtb-card-converted"})
+        return self._wrap_in_group(blocks, {"className": "devtb-card-converted"})
 
     def _convert_cta(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -615,7 +703,7 @@ class GutenbergConverter:
                 self._build_buttons_block_from_settings({"text": button_text, "link": link})
             )
 
-        return self._wrap_in_group("\n".join(blocks), {"className": "devtb-cta-converted"})
+        return self._wrap_in_group(blocks, {"className": "devtb-cta-converted"})
 
     def _convert_counter(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -631,7 +719,7 @@ class GutenbergConverter:
         if title:
             blocks.append(self._build_paragraph_block({"editor": title}))
 
-        return self._wrap_in_group("\n".join(blocks), {"className": "devtb-counter-converted"})
+        return self._wrap_in_group(blocks, {"className": "devtb-counter-converted"})
 
     def _convert_testimonial(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -643,7 +731,7 @@ class GutenbergConverter:
         body = content if self._looks_like_html(content) else f"<p>{escape(str(content))}</p>"
         cite_html = f"<cite>{escape(cite)}</cite>" if cite else ""
         html = f'<blockquote class="wp-block-quote">{body}{cite_html}</blockquote>'
-        return self._build_block("core/quote", {}, html)
+        return _bare_block("quote", html)
 
     def _convert_pricing_table(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -670,21 +758,12 @@ class GutenbergConverter:
                 features = []
         if isinstance(features, list) and features:
             # Build a canonical core/list with core/list-item innerBlocks.
-            item_blocks: List[str] = []
-            for f in features:
-                if not isinstance(f, dict):
-                    continue
-                text = f.get("item_text", f.get("text", ""))
-                item_blocks.append(
-                    self._build_block("core/list-item", {}, f"<li>{escape(str(text))}</li>")
-                )
-            blocks.append(
-                self._build_block(
-                    "core/list",
-                    {},
-                    '<ul class="wp-block-list">\n' + "\n".join(item_blocks) + "\n</ul>",
-                )
-            )
+            texts = [
+                str(f.get("item_text", f.get("text", "")))
+                for f in features
+                if isinstance(f, dict)
+            ]
+            blocks.append(_bare_block("list", _list_html(texts)))
 
         button_text = settings.get("button_text") or "Get started"
         button_url = settings.get("button_url") or ""
@@ -698,7 +777,7 @@ class GutenbergConverter:
                 )
             )
 
-        return self._wrap_in_group("\n".join(blocks), {"className": "devtb-pricing-converted"})
+        return self._wrap_in_group(blocks, {"className": "devtb-pricing-converted"})
 
     def _convert_alert(self, component: Dict[str, Any]) -> str:
         settings = component["settings"]
@@ -714,7 +793,7 @@ class GutenbergConverter:
 
         safe_type = re.sub(r"[^a-z0-9_-]", "", str(alert_type), flags=re.IGNORECASE)
         return self._wrap_in_group(
-            "\n".join(blocks),
+            blocks,
             {"className": f"devtb-alert is-style-{safe_type}"},
         )
 
@@ -748,36 +827,23 @@ class GutenbergConverter:
         comment = (
             f'<!-- devtb: unconverted {escape(framework)} widget "{escape(str(widget_type))}" -->'
         )
-        return self._build_block("core/html", {}, f"{comment}\n{inner}")
+        return _bare_block("html", f"{comment}\n{inner}")
 
     # ----- containers -----
 
     def _build_columns_block(self, columns: List[Dict[str, Any]], settings: Dict[str, Any]) -> str:
         column_blocks = [self._convert_column(c) for c in columns if isinstance(c, dict)]
-        inner = "\n".join(column_blocks)
-        html = f'<div class="wp-block-columns">\n{inner}\n</div>'
-        return self._build_block("core/columns", self._denormalize_settings(settings), html)
+        return self._build_wrapper_block(
+            "core/columns", self._denormalize_settings(settings), _COLUMNS_DIV, column_blocks
+        )
 
     def _build_group_block(self, children: List[Dict[str, Any]], settings: Dict[str, Any]) -> str:
-        inner_blocks: List[str] = []
-        for child in children:
-            if not isinstance(child, dict):
-                continue
-            el_type = child.get("elType")
-            if el_type == "widget":
-                inner_blocks.append(self._convert_widget(child))
-            elif el_type == "column":
-                inner_blocks.append(self._convert_column(child))
-            elif el_type in ("section", "container"):
-                inner_blocks.append(self._convert_section(child))
-            else:
-                inner_blocks.append(self._convert_component(child))
-        inner = "\n".join(b for b in inner_blocks if b)
-        return self._wrap_in_group(inner, self._denormalize_settings(settings))
+        return self._wrap_in_group(
+            self._convert_children(children), self._denormalize_settings(settings)
+        )
 
-    def _wrap_in_group(self, inner_content: str, attrs: Dict[str, Any]) -> str:
-        html = f'<div class="wp-block-group">\n{inner_content}\n</div>'
-        return self._build_block("core/group", attrs, html)
+    def _wrap_in_group(self, blocks: List[str], attrs: Dict[str, Any]) -> str:
+        return self._build_wrapper_block("core/group", attrs, _GROUP_DIV, blocks)
 
     # ----- helpers -----
 
@@ -785,10 +851,26 @@ class GutenbergConverter:
         # Canonical WordPress serialization drops the `core/` namespace from core blocks.
         name = block_type[5:] if block_type.startswith("core/") else block_type
         if attrs:
-            attrs_json = json.dumps(attrs, separators=(",", ":"), ensure_ascii=False)
+            attrs_json = _dump_attrs(attrs)
             return f"<!-- wp:{name} {attrs_json} -->\n{html}\n<!-- /wp:{name} -->"
         return f"<!-- wp:{name} -->\n{html}\n<!-- /wp:{name} -->"
 
+    def _build_wrapper_block(
+        self, block_type: str, attrs: Dict[str, Any], div_open: str, blocks: List[str]
+    ) -> str:
+        """Wrap child blocks in a <div> block with a single join.
+
+        Equivalent to ``_build_block(block_type, attrs, div_open + "\\n" +
+        "\\n".join(blocks) + "\\n</div>")``, but each nesting level copies its
+        children once instead of once per concatenation.
+        """
+        name = block_type[5:] if block_type.startswith("core/") else block_type
+        if attrs:
+            head = f"<!-- wp:{name} {_dump_attrs(attrs)} -->\n{div_open}"
+        else:
+            head = f"<!-- wp:{name} -->\n{div_open}"
+        return "\n".join([head, *(blocks or ("",)), f"</div>\n<!-- /wp:{name} -->"])
+
     def _parse_heading_level(self, value: Any) -> int:
         if isinstance(value, int):
             return max(1, min(6, value))
@@ -916,3 +998,9 @@ class GutenbergConverter:
             if value.get(side) not in (None, ""):
                 out[side] = f"{value[side]}{unit}"
         return out
+
+
+# Shared instance for the registry transforms. The converter holds no
+# per-document state, so reusing it across calls only keeps the widget markup
+# cache warm; the cache is locked, so concurrent transforms may share it.
+gutenberg_converter = GutenbergConverter()
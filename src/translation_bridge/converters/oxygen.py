@@ -23,7 +23,9 @@ responsive data (``element["responsive"]``, see
 ``options.media.<breakpoint>.original`` (tablet, phone-portrait).
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 import json
 import re
 
@@ -102,6 +104,18 @@ def _unitless(props: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
+# Shared empty default for list-valued lookups. Nested .get() defaults are
+# evaluated on every call, so a [] literal there allocates even when the
+# outer key is present; the empty tuple is a singleton and is only iterated.
+_NO_ITEMS: Tuple[Any, ...] = ()
+
+
+@lru_cache(maxsize=None)
+def _selector_base(element_name: str) -> str:
+    """``ct_text_block`` -> ``text-block``; element names are a small fixed set."""
+    return re.sub(r"^(ct_|oxy_)", "", element_name).replace("_", "-")
+
+
 class OxygenConverter:
     """Converts parsed content to classic Oxygen Builder JSON."""
 
@@ -165,16 +179,77 @@ class OxygenConverter:
         ["ct_section", "ct_div_block", "ct_new_columns", "ct_column", "ct_inner_content", "oxy_superbox"]
     )
 
+    # Universal type -> content-options builder method. Types not listed use
+    # _fallback_options.
+    OPTION_BUILDERS = {
+        "section": "_no_options",
+        "container": "_no_options",
+        "column": "_no_options",
+        "row": "_no_options",
+        "tabs": "_no_options",  # tab items expand into child elements (_composite_children)
+        "accordion": "_no_options",
+        "toggle": "_no_options",
+        "heading": "_heading_options",
+        "text": "_text_options",
+        "paragraph": "_text_options",
+        "text-editor": "_text_options",
+        "counter": "_text_options",
+        "image": "_image_options",
+        "button": "_button_options",
+        "link": "_button_options",
+        "video": "_video_options",
+        "icon": "_icon_options",
+        "icon-box": "_icon_box_options",
+        "card": "_icon_box_options",
+        "testimonial": "_testimonial_options",
+        "blockquote": "_testimonial_options",
+        "quote": "_testimonial_options",
+        "alert": "_alert_options",
+        "call-to-action": "_cta_options",
+        "cta": "_cta_options",
+        "price-table": "_pricing_options",
+        "pricing-table": "_pricing_options",
+        "icon-list": "_icon_list_options",
+        "audio": "_audio_options",
+        "map": "_map_options",
+        "google_maps": "_map_options",
+        "progress": "_progress_options",
+        "html": "_code_options",
+        "code": "_code_options",
+        "gallery": "_gallery_options",
+        "image-gallery": "_gallery_options",
+        "carousel": "_gallery_options",
+        "slider": "_gallery_options",
+    }
+
+    # Shared encoder for convert(), equivalent to json.dumps(..., indent=2).
+    # The tree is freshly built, so the circular-reference scan is skipped.
+    _JSON_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+
     def __init__(self):
-        self._id_counter = 0
+        self._ids: Iterator[int] = count(1)
+        self._option_builders = self._resolve_option_builders()
+
+    @classmethod
+    def _resolve_option_builders(cls) -> Dict[str, Callable[..., Dict[str, Any]]]:
+        """Resolve OPTION_BUILDERS to plain functions once per class.
+
+        The table is cached on the class itself (not inherited), so every
+        instance shares it and subclasses that override a builder get their own.
+        """
+        resolved = cls.__dict__.get("_option_functions")
+        if resolved is None:
+            resolved = {universal: getattr(cls, name) for universal, name in cls.OPTION_BUILDERS.items()}
+            cls._option_functions = resolved
+        return resolved
 
     def convert(self, data: Any) -> str:
         """Convert universal data to an Oxygen root-tree JSON string."""
-        return json.dumps(self.convert_to_dict(data), indent=2)
+        return self._JSON_ENCODER.encode(self.convert_to_dict(data))
 
     def convert_to_dict(self, data: Any) -> Dict[str, Any]:
         """Convert universal data to the Oxygen root-tree structure."""
-        self._id_counter = 0
+        self._ids = count(1)
         children = self._convert_to_elements(data, parent_id=0)
         return {"id": 0, "name": "root", "depth": 0, "children": children}
 
@@ -199,7 +274,37 @@ class OxygenConverter:
         return []
 
     def _convert_element(self, element: Dict[str, Any], parent_id: int) -> Optional[Dict[str, Any]]:
-        """Convert a single element and its children."""
+        """Convert a single element and its children.
+
+        The tree is walked in a single pass with an explicit stack rather than
+        recursion: each frame is opened (ID assigned, options built) before its
+        children, and closed once they are all converted, so IDs stay in
+        document order. Frames are plain tuples (see _open_element); the last
+        slot is the children list that becomes the node's "children".
+        """
+        root, root_src = self._open_element(element, parent_id)
+        stack = [(root, iter(root_src))]
+        while stack:
+            frame, pending = stack[-1]
+            for item in pending:
+                if isinstance(item, dict):
+                    child, child_src = self._open_element(item, frame[1])
+                    stack.append((child, iter(child_src)))
+                    break
+            else:
+                stack.pop()
+                node = self._close_element(frame)
+                if not stack:
+                    return node
+                stack[-1][0][-1].append(node)
+        return None
+
+    def _open_element(self, element: Dict[str, Any], parent_id: int) -> Tuple[tuple, List[Any]]:
+        """Resolve an element's name, ID, and options ahead of its children.
+
+        Returns the frame ``(element, id, parent_id, name, universal, settings,
+        widget_options, children)`` and the source children still to convert.
+        """
         el_type = element.get("elType", element.get("type", ""))
         widget_type = element.get("widgetType", "")
 
@@ -217,19 +322,30 @@ class OxygenConverter:
         if parent_id == 0 and element_name == "ct_div_block" and universal in ("container", ""):
             element_name = "ct_section"
 
-        element_id = self._generate_id()
+        element_id = next(self._ids)
         settings = element.get("settings", element.get("attributes", {})) or {}
         content = element.get("content", "")
 
+        children_src = element.get("elements", element.get("children", _NO_ITEMS)) or _NO_ITEMS
+        composite = self._composite_children(universal, settings)
+        if composite:
+            children_src = [*children_src, *composite]
         widget_options = self._build_widget_options(universal, element_name, settings, content)
-
-        children_src = list(element.get("elements", element.get("children", [])) or [])
-        children_src += self._composite_children(universal, settings)
-        children = [
-            child
-            for item in children_src
-            if isinstance(item, dict) and (child := self._convert_element(item, element_id))
-        ]
+        frame = (element, element_id, parent_id, element_name, universal, settings, widget_options, [])
+        return frame, children_src
+
+    def _close_element(self, frame: tuple) -> Dict[str, Any]:
+        """Assemble an opened element once all of its children are converted."""
+        (
+            element,
+            element_id,
+            parent_id,
+            element_name,
+            universal,
+            settings,
+            widget_options,
+            children,
+        ) = frame
 
         # A content-carrying widget mapped onto a container element (forms,
         # unknown vocabularies) must not lose its text: leaf widgets become a
@@ -273,8 +389,7 @@ class OxygenConverter:
 
     def _selector(self, element_name: str, element_id: int) -> str:
         """Deterministic selector mirroring Oxygen's `{type}-{id}-{post}` shape."""
-        base = re.sub(r"^(ct_|oxy_)", "", element_name).replace("_", "-")
-        return f"{base}-{element_id}-tb"
+        return f"{_selector_base(element_name)}-{element_id}-tb"
 
     def _build_original(self, element: Dict[str, Any], settings: Dict[str, Any]) -> Dict[str, Any]:
         """Design props -> options.original (full passthrough, unitless)."""
@@ -305,181 +420,11 @@ class OxygenConverter:
         self, universal: str, element_name: str, settings: Dict[str, Any], content: str = ""
     ) -> Dict[str, Any]:
         """Build content/semantic Oxygen options from universal settings."""
-        options: Dict[str, Any] = {}
-
-        if universal == "heading":
-            text = content or settings.get("title", "")
-            options["headline_text"] = text
-            options["ct_content"] = text
-            options["tag"] = settings.get("header_size", settings.get("tag", "h2"))
-
-        elif universal in ("text", "paragraph", "text-editor", "counter"):
-            text = content or settings.get("editor", settings.get("text", settings.get("title", "")))
-            if text:
-                options["text"] = text
-                options["ct_content"] = text
-
-        elif universal == "image":
-            image = settings.get("image", {})
-            if isinstance(image, dict):
-                options["src"] = image.get("url", settings.get("src", ""))
-                options["alt"] = image.get("alt", settings.get("alt", ""))
-            else:
-                options["src"] = settings.get("src", settings.get("image_url", ""))
-                options["alt"] = settings.get("alt", settings.get("alt_text", ""))
-
-        elif universal in ("button", "link"):
-            text = content or settings.get("text", settings.get("label", ""))
-            if text:
-                options["text"] = text
-                options["ct_content"] = text
-            link = settings.get("link", {})
-            if isinstance(link, dict) and link.get("url"):
-                options["url"] = link["url"]
-            elif settings.get("url"):
-                options["url"] = settings["url"]
-
-        elif universal == "video":
-            url = settings.get("youtube_url", settings.get("video_url", settings.get("url", "")))
-            if url:
-                options["embed_code"] = url
-                options["video_type"] = "youtube"
-
-        elif universal == "icon":
-            icon = settings.get("selected_icon", settings.get("icon", ""))
-            if isinstance(icon, dict):
-                icon = icon.get("value", "")
-            if icon:
-                options["icon"] = icon
-
-        elif universal in ("icon-box", "card"):
-            options["heading"] = content or settings.get("title_text", settings.get("title", ""))
-            options["text"] = settings.get("description_text", settings.get("description", ""))
-            icon = settings.get("selected_icon", {})
-            if isinstance(icon, dict) and icon.get("value"):
-                options["icon"] = icon["value"]
-            if settings.get("button_text"):
-                options["button_text"] = settings["button_text"]
-            link = settings.get("link", {})
-            if isinstance(link, dict) and link.get("url"):
-                options["url"] = link["url"]
-            image = settings.get("image", {})
-            if isinstance(image, dict) and image.get("url"):
-                options["image_src"] = image["url"]
-                if image.get("alt"):
-                    options["image_alt"] = image["alt"]
-
-        elif universal in ("testimonial", "blockquote", "quote"):
-            options["testimonial_text"] = content or settings.get(
-                "testimonial_content",
-                settings.get("blockquote_content", settings.get("quote", "")),
-            )
-            options["author"] = settings.get("testimonial_name", settings.get("author", ""))
-            options["title"] = settings.get("testimonial_job", settings.get("author_title", ""))
-
-        elif universal == "alert":
-            parts = []
-            if settings.get("alert_title"):
-                parts.append(f"<strong>{settings['alert_title']}</strong>")
-            body = content or settings.get("alert_description", "")
-            if body:
-                parts.append(f"<p>{body}</p>")
-            if parts:
-                options["ct_content"] = "".join(parts)
-
-        elif universal in ("call-to-action", "cta"):
-            parts = []
-            if settings.get("title"):
-                parts.append(f"<h2>{settings['title']}</h2>")
-            body = content or settings.get("description", "")
-            if body:
-                parts.append(f"<p>{body}</p>")
-            link = settings.get("link", {})
-            url = link.get("url", "") if isinstance(link, dict) else settings.get("url", "")
-            button_text = settings.get("button_text", "")
-            if button_text or url:
-                parts.append(f'<a href="{url}">{button_text}</a>')
-            if parts:
-                options["ct_content"] = "".join(parts)
-
-        elif universal in ("price-table", "pricing-table"):
-            options["heading"] = settings.get("heading", settings.get("title", ""))
-            price = settings.get("price", "")
-            if price != "":
-                options["price"] = f"{settings.get('currency_symbol', '')}{price}"
-            if settings.get("period"):
-                options["period"] = settings["period"]
-            features = settings.get("features", settings.get("items", []))
-            texts = [
-                item.get("item_text", item.get("text", ""))
-                for item in features
-                if isinstance(item, dict)
-            ]
-            if any(texts):
-                options["features"] = texts
-            if settings.get("button_text"):
-                options["button_text"] = settings["button_text"]
-            link = settings.get("link", {})
-            button_url = settings.get("button_url", "") or (
-                link.get("url", "") if isinstance(link, dict) else ""
-            )
-            if button_url:
-                options["button_url"] = button_url
-
-        elif universal == "icon-list":
-            items = settings.get("icon_list", settings.get("items", []))
-            lis = "".join(
-                f"<li>{item['text']}</li>"
-                for item in items
-                if isinstance(item, dict) and item.get("text")
-            )
-            if lis:
-                options["ct_content"] = f"<ul>{lis}</ul>"
-
-        elif universal in ("tabs", "accordion", "toggle"):
-            pass  # tab items expand into child elements (_composite_children)
-
-        elif universal == "audio":
-            link = settings.get("link", {})
-            url = link.get("url", "") if isinstance(link, dict) else (link or settings.get("url", ""))
-            if url:
-                options["code"] = f'<audio controls src="{url}"></audio>'
-
-        elif universal in ("map", "google_maps"):
-            if settings.get("address"):
-                options["address"] = settings["address"]
-
-        elif universal == "progress":
-            percent = settings.get("percent", {})
-            options["percentage"] = percent.get("size", 50) if isinstance(percent, dict) else percent or 50
-            if settings.get("title"):
-                options["title"] = settings["title"]
-
-        elif universal in ("html", "code"):
-            options["code"] = content or settings.get("html", settings.get("code", ""))
-
-        elif universal in ("gallery", "image-gallery", "carousel", "slider"):
-            gallery = settings.get("gallery", settings.get("wp_gallery", []))
-            images = [
-                {"url": img.get("url", ""), "alt": img.get("alt", ""), "id": img.get("id", "")}
-                for img in gallery
-                if isinstance(img, dict)
-            ]
-            if images:
-                options["images"] = images
-            if settings.get("title"):
-                options["title"] = settings["title"]
-
-        elif universal not in ("section", "container", "column", "row"):
-            # No native classic-Oxygen equivalent: preserve every
-            # content-bearing setting rather than dropping it.
-            strings = _content_strings(settings)
-            if content and content.strip() and content.strip() not in strings:
-                strings.insert(0, content.strip())
-            if strings:
-                text = "\n".join(strings)
-                options["text"] = text
-                options["ct_content"] = text
+        builder = self._option_builders.get(universal)
+        if builder is None:
+            options = self._fallback_options(settings, content)
+        else:
+            options = builder(self, settings, content)
 
         # Common options.
         if settings.get("align"):
@@ -487,13 +432,224 @@ class OxygenConverter:
 
         return options
 
-    def _composite_children(self, universal: str, settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _no_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        """Structural elements and item-list composites carry no content options."""
+        return {}
+
+    def _heading_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        text = content or settings.get("title", "")
+        try:
+            tag = settings["header_size"]
+        except KeyError:
+            tag = settings.get("tag", "h2")
+        return {"headline_text": text, "ct_content": text, "tag": tag}
+
+    def _text_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        # Direct indexing on the common key; fall back through the aliases
+        # lazily rather than evaluating every nested .get() default up front.
+        text = content
+        if not text:
+            try:
+                text = settings["editor"]
+            except KeyError:
+                text = settings.get("text", settings.get("title", ""))
+        if text:
+            return {"text": text, "ct_content": text}
+        return {}
+
+    def _image_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        image = settings.get("image", {})
+        if isinstance(image, dict):
+            try:
+                src = image["url"]
+            except KeyError:
+                src = settings.get("src", "")
+            try:
+                alt = image["alt"]
+            except KeyError:
+                alt = settings.get("alt", "")
+            return {"src": src, "alt": alt}
+        return {
+            "src": settings.get("src", settings.get("image_url", "")),
+            "alt": settings.get("alt", settings.get("alt_text", "")),
+        }
+
+    def _button_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+        text = content or settings.get("text", settings.get("label", ""))
+        if text:
+            options["text"] = text
+            options["ct_content"] = text
+        link = settings.get("link", {})
+        if isinstance(link, dict) and link.get("url"):
+            options["url"] = link["url"]
+        elif settings.get("url"):
+            options["url"] = settings["url"]
+        return options
+
+    def _video_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        try:
+            url = settings["youtube_url"]
+        except KeyError:
+            url = settings.get("video_url", settings.get("url", ""))
+        if url:
+            return {"embed_code": url, "video_type": "youtube"}
+        return {}
+
+    def _icon_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        icon = settings.get("selected_icon", settings.get("icon", ""))
+        if isinstance(icon, dict):
+            icon = icon.get("value", "")
+        return {"icon": icon} if icon else {}
+
+    def _icon_box_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {
+            "heading": content or settings.get("title_text", settings.get("title", "")),
+            "text": settings.get("description_text", settings.get("description", "")),
+        }
+        icon = settings.get("selected_icon", {})
+        if isinstance(icon, dict) and icon.get("value"):
+            options["icon"] = icon["value"]
+        if settings.get("button_text"):
+            options["button_text"] = settings["button_text"]
+        link = settings.get("link", {})
+        if isinstance(link, dict) and link.get("url"):
+            options["url"] = link["url"]
+        image = settings.get("image", {})
+        if isinstance(image, dict) and image.get("url"):
+            options["image_src"] = image["url"]
+            if image.get("alt"):
+                options["image_alt"] = image["alt"]
+        return options
+
+    def _testimonial_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        text = content
+        if not text:
+            try:
+                text = settings["testimonial_content"]
+            except KeyError:
+                text = settings.get("blockquote_content", settings.get("quote", ""))
+        return {
+            "testimonial_text": text,
+            "author": settings.get("testimonial_name", settings.get("author", "")),
+            "title": settings.get("testimonial_job", settings.get("author_title", "")),
+        }
+
+    def _alert_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        parts = []
+        if settings.get("alert_title"):
+            parts.append(f"<strong>{settings['alert_title']}</strong>")
+        body = content or settings.get("alert_description", "")
+        if body:
+            parts.append(f"<p>{body}</p>")
+        return {"ct_content": "".join(parts)} if parts else {}
+
+    def _cta_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        parts = []
+        if settings.get("title"):
+            parts.append(f"<h2>{settings['title']}</h2>")
+        body = content or settings.get("description", "")
+        if body:
+            parts.append(f"<p>{body}</p>")
+        link = settings.get("link", {})
+        url = link.get("url", "") if isinstance(link, dict) else settings.get("url", "")
+        button_text = settings.get("button_text", "")
+        if button_text or url:
+            parts.append(f'<a href="{url}">{button_text}</a>')
+        return {"ct_content": "".join(parts)} if parts else {}
+
+    def _pricing_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"heading": settings.get("heading", settings.get("title", ""))}
+        price = settings.get("price", "")
+        if price != "":
+            options["price"] = f"{settings.get('currency_symbol', '')}{price}"
+        if settings.get("period"):
+            options["period"] = settings["period"]
+        features = settings.get("features", settings.get("items", _NO_ITEMS))
+        texts = [
+            item.get("item_text", item.get("text", ""))
+            for item in features
+            if isinstance(item, dict)
+        ]
+        if any(texts):
+            options["features"] = texts
+        if settings.get("button_text"):
+            options["button_text"] = settings["button_text"]
+        link = settings.get("link", {})
+        button_url = settings.get("button_url", "") or (
+            link.get("url", "") if isinstance(link, dict) else ""
+        )
+        if button_url:
+            options["button_url"] = button_url
+        return options
+
+    def _icon_list_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        items = settings.get("icon_list", settings.get("items", _NO_ITEMS))
+        lis = "".join(
+            f"<li>{item['text']}</li>"
+            for item in items
+            if isinstance(item, dict) and item.get("text")
+        )
+        return {"ct_content": f"<ul>{lis}</ul>"} if lis else {}
+
+    def _audio_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        link = settings.get("link", {})
+        url = link.get("url", "") if isinstance(link, dict) else (link or settings.get("url", ""))
+        return {"code": f'<audio controls src="{url}"></audio>'} if url else {}
+
+    def _map_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        return {"address": settings["address"]} if settings.get("address") else {}
+
+    def _progress_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        percent = settings.get("percent", {})
+        options: Dict[str, Any] = {
+            "percentage": percent.get("size", 50) if isinstance(percent, dict) else percent or 50
+        }
+        if settings.get("title"):
+            options["title"] = settings["title"]
+        return options
+
+    def _code_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        return {"code": content or settings.get("html", settings.get("code", ""))}
+
+    def _gallery_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+        gallery = settings.get("gallery", settings.get("wp_gallery", _NO_ITEMS))
+        # Exports often repeat an attachment; keep the first image per ID.
+        # Images without a usable ID are keyed by position so all of them survive.
+        images: Dict[Any, Dict[str, Any]] = {}
+        for index, img in enumerate(gallery):
+            if not isinstance(img, dict):
+                continue
+            image_id = img.get("id", "")
+            key = image_id if image_id and isinstance(image_id, (int, str)) else ("", index)
+            images.setdefault(key, {"url": img.get("url", ""), "alt": img.get("alt", ""), "id": image_id})
+        if images:
+            options["images"] = list(images.values())
+        if settings.get("title"):
+            options["title"] = settings["title"]
+        return options
+
+    def _fallback_options(self, settings: Dict[str, Any], content: str) -> Dict[str, Any]:
+        """No native classic-Oxygen equivalent: preserve every content-bearing
+        setting rather than dropping it."""
+        strings = _content_strings(settings)
+        if content and content.strip() and content.strip() not in strings:
+            strings.insert(0, content.strip())
+        if strings:
+            text = "\n".join(strings)
+            return {"text": text, "ct_content": text}
+        return {}
+
+    def _composite_children(
+        self, universal: str, settings: Dict[str, Any]
+    ) -> Sequence[Dict[str, Any]]:
         """Expand item-list composites (tabs/accordion) into pseudo-universal
         children so each pane survives as real classic-Oxygen elements."""
         if universal not in ("tabs", "accordion", "toggle"):
-            return []
+            return _NO_ITEMS
         children: List[Dict[str, Any]] = []
-        items = settings.get("tabs", settings.get("items", []))
+        items = settings.get("tabs", settings.get("items", _NO_ITEMS))
         for item in items if isinstance(items, list) else []:
             if not isinstance(item, dict):
                 continue
@@ -517,8 +673,7 @@ class OxygenConverter:
 
     def _generate_id(self) -> int:
         """Generate unique Oxygen element ID."""
-        self._id_counter += 1
-        return self._id_counter
+        return next(self._ids)
 
     def get_framework(self) -> str:
         return "oxygen"
@@ -12,11 +12,92 @@ Supports:
 - Custom CSS passthrough
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 
+from .._compat import DATACLASS_OPTIONS
 
-@dataclass
+
+_CONTAINER_CSS = """/* Container */
+.container-custom {
+  width: 100%;
+  max-width: var(--container-width);
+  margin-left: auto;
+  margin-right: auto;
+  padding-left: 15px;
+  padding-right: 15px;
+}
+"""
+
+# Distinct token sets whose rendered output is kept (per output format).
+_OUTPUT_CACHE_SIZE = 32
+
+
+def _slug(name: str) -> str:
+    """CSS-safe token name: lowercase, spaces and underscores become hyphens.
+
+    Two chained str.replace calls; for short ASCII names this is several
+    times faster than str.translate with a mapping table.
+    """
+    return name.lower().replace(" ", "-").replace("_", "-")
+
+
+@lru_cache(maxsize=256)
+def _color_category(key: str) -> str:
+    """Categorize a color by its key; sites reuse the same few keys.
+
+    Categories are checked in priority order, not by position in the key
+    ("accent_primary" is primary), so a single alternation regex won't do.
+    """
+    key_lower = key.lower()
+    if "primary" in key_lower:
+        return "primary"
+    elif "secondary" in key_lower:
+        return "secondary"
+    elif "text" in key_lower or "body" in key_lower:
+        return "text"
+    elif "accent" in key_lower:
+        return "accent"
+    return "primary"
+
+
+def _typed(*values: Any) -> Tuple[Tuple[type, Any], ...]:
+    """Pair each value with its class for use in a cache key.
+
+    ``1140`` and ``1140.0`` (or ``True`` and ``1``) are equal and hash alike
+    but render differently, so the class must be part of the key.
+    """
+    return tuple([(v.__class__, v) for v in values])
+
+
+def _tokens_fingerprint(tokens: "DesignTokens") -> Optional[Tuple[Any, ...]]:
+    """Return a hashable snapshot of every field the emitters read, else None.
+
+    Token values come straight from site JSON, so an unhashable value simply
+    disables caching for that token set.
+    """
+    key = (
+        tuple([_typed(c.id, c.name, c.value, c.category) for c in tokens.colors]),
+        tuple([
+            _typed(f.id, f.name, f.family, f.weight, f.size, f.line_height, f.letter_spacing)
+            for f in tokens.fonts
+        ]),
+        tuple([_typed(s.name, s.value, s.unit) for s in tokens.spacing]),
+        _typed(tokens.container_width, tokens.custom_css),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ColorToken:
     """Represents a color design token."""
 
@@ -24,14 +105,17 @@ class ColorToken:
     name: str
     value: str
     category: str = "primary"  # primary, secondary, text, accent
+    @property
+    def slug(self) -> str:
+        """Name used by every output format; follows edits to ``name``."""
+        return _slug(self.name)
 
     def to_css_variable(self) -> str:
         """Convert to CSS custom property declaration."""
-        var_name = self.name.lower().replace(" ", "-").replace("_", "-")
-        return f"--color-{var_name}: {self.value};"
+        return f"--color-{self.slug}: {self.value};"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FontToken:
     """Represents a typography design token."""
 
@@ -42,11 +126,14 @@ class FontToken:
     size: str = ""
     line_height: str = ""
     letter_spacing: str = ""
+    @property
+    def slug(self) -> str:
+        """Name used by every output format; follows edits to ``name``."""
+        return _slug(self.name)
 
     def to_css_variable(self) -> str:
         """Convert to CSS custom property declaration."""
-        var_name = self.name.lower().replace(" ", "-").replace("_", "-")
-        return f"--font-{var_name}: '{self.family}', sans-serif;"
+        return f"--font-{self.slug}: '{self.family}', sans-serif;"
 
     def to_font_face(self) -> str:
         """Generate @font-face or import if web font."""
@@ -54,21 +141,24 @@ class FontToken:
         return f"{self.family}:wght@{self.weight}"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SpacingToken:
     """Represents a spacing design token."""
 
     name: str
     value: str
     unit: str = "px"
+    @property
+    def slug(self) -> str:
+        """Name used by every output format; keeps underscores, unlike colors."""
+        return self.name.lower().replace(" ", "-")
 
     def to_css_variable(self) -> str:
         """Convert to CSS custom property declaration."""
-        var_name = self.name.lower().replace(" ", "-")
-        return f"--spacing-{var_name}: {self.value}{self.unit};"
+        return f"--spacing-{self.slug}: {self.value}{self.unit};"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DesignTokens:
     """Collection of all design tokens from a site."""
 
@@ -105,7 +195,7 @@ class StylesConverter:
     """
 
     # Default spacing scale (matches Elementor defaults)
-    DEFAULT_SPACING_SCALE = [
+    DEFAULT_SPACING_SCALE: Tuple[Tuple[str, str], ...] = (
         ("xs", "4"),
         ("sm", "8"),
         ("md", "16"),
@@ -113,7 +203,20 @@ class StylesConverter:
         ("xl", "32"),
         ("2xl", "48"),
         ("3xl", "64"),
-    ]
+    )
+
+    # Color category -> Bootstrap SCSS variable it overrides.
+    BOOTSTRAP_COLOR_VARIABLES: Mapping[str, str] = MappingProxyType({
+        "primary": "$primary",
+        "secondary": "$secondary",
+        "text": "$body-color",
+        "accent": "$info",
+    })
+
+    # Process-wide rendered output keyed by (class, format, token fingerprint),
+    # shared by every converter instance; see _cached_output.
+    _output_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+    _output_cache_lock = threading.Lock()
 
     def __init__(self):
         self.tokens: Optional[DesignTokens] = None
@@ -131,45 +234,52 @@ class StylesConverter:
         tokens = DesignTokens()
 
         # Extract colors
-        colors_data = site_settings.get("system_colors", site_settings.get("colors", {}))
+        colors_data = site_settings.get("system_colors")
+        if colors_data is None:
+            colors_data = site_settings.get("colors")
         if isinstance(colors_data, dict):
+            append_color = tokens.colors.append
             for key, color_data in colors_data.items():
                 if isinstance(color_data, dict):
-                    tokens.colors.append(ColorToken(
-                        id=color_data.get("_id", key),
-                        name=color_data.get("title", key),
-                        value=color_data.get("color", "#000000"),
-                        category=self._categorize_color(key),
+                    get = color_data.get
+                    append_color(ColorToken(
+                        id=get("_id", key),
+                        name=get("title", key),
+                        value=get("color", "#000000"),
+                        category=_color_category(key),
                     ))
 
         # Extract fonts
-        fonts_data = site_settings.get("system_typography", site_settings.get("typography", {}))
+        fonts_data = site_settings.get("system_typography")
+        if fonts_data is None:
+            fonts_data = site_settings.get("typography")
         if isinstance(fonts_data, dict):
+            append_font = tokens.fonts.append
+            size_parts = self._extract_size_parts
             for key, font_data in fonts_data.items():
                 if isinstance(font_data, dict):
-                    tokens.fonts.append(FontToken(
-                        id=font_data.get("_id", key),
-                        name=font_data.get("title", key),
-                        family=font_data.get("font_family", "Inter"),
-                        weight=str(font_data.get("font_weight", "400")),
-                        size=self._extract_size(font_data.get("font_size", {})),
-                        line_height=self._extract_size(font_data.get("line_height", {})),
-                        letter_spacing=self._extract_size(font_data.get("letter_spacing", {})),
+                    get = font_data.get
+                    append_font(FontToken(
+                        id=get("_id", key),
+                        name=get("title", key),
+                        family=get("font_family", "Inter"),
+                        weight=str(get("font_weight", "400")),
+                        size=size_parts(get("font_size", {}))[2],
+                        line_height=size_parts(get("line_height", {}))[2],
+                        letter_spacing=size_parts(get("letter_spacing", {}))[2],
                     ))
 
         # Extract spacing scale if present
-        spacing_data = site_settings.get("spacing", {})
+        spacing_data = site_settings.get("spacing")
         if spacing_data:
             for name, value in spacing_data.items():
-                tokens.spacing.append(SpacingToken(
-                    name=name,
-                    value=str(self._extract_size_value(value)),
-                    unit=self._extract_size_unit(value),
-                ))
+                numeric, unit, _ = self._extract_size_parts(value)
+                tokens.spacing.append(SpacingToken(name=name, value=numeric, unit=unit))
         else:
             # Use default spacing scale
-            for name, value in self.DEFAULT_SPACING_SCALE:
-                tokens.spacing.append(SpacingToken(name=name, value=value))
+            tokens.spacing = [
+                SpacingToken(name=name, value=value) for name, value in self.DEFAULT_SPACING_SCALE
+            ]
 
         # Container width
         container_width = site_settings.get("container_width", {})
@@ -197,88 +307,91 @@ class StylesConverter:
         tokens = tokens or self.tokens
         if not tokens:
             return ""
+        return self._cached_output("css", tokens, self._render_css)
 
-        lines = []
-
-        # Google Fonts import
-        fonts_import = self._generate_google_fonts_import(tokens.fonts)
-        if fonts_import:
-            lines.append(fonts_import)
-            lines.append("")
-
-        # CSS custom properties
-        lines.append(":root {")
-        lines.append("  /* Colors */")
-        for color in tokens.colors:
-            lines.append(f"  {color.to_css_variable()}")
-
-        lines.append("")
-        lines.append("  /* Typography */")
-        for font in tokens.fonts:
-            lines.append(f"  {font.to_css_variable()}")
-
-        lines.append("")
-        lines.append("  /* Spacing */")
-        for spacing in tokens.spacing:
-            lines.append(f"  {spacing.to_css_variable()}")
+    def iter_css(self, tokens: Optional[DesignTokens] = None) -> Iterator[str]:
+        """
+        Yield the CSS produced by to_css in newline-terminated chunks.
 
-        lines.append("")
-        lines.append("  /* Layout */")
-        lines.append(f"  --container-width: {tokens.container_width}px;")
+        Lets callers stream large stylesheets, e.g. ``f.writelines(...)``,
+        without holding the whole output in memory.
 
-        lines.append("}")
-        lines.append("")
+        Args:
+            tokens: Design tokens (uses self.tokens if None)
 
-        # Utility classes for colors
-        lines.append("/* Color utility classes */")
-        for color in tokens.colors:
-            var_name = color.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f".text-{var_name} {{ color: var(--color-{var_name}); }}")
-            lines.append(f".bg-{var_name} {{ background-color: var(--color-{var_name}); }}")
-            lines.append(f".border-{var_name} {{ border-color: var(--color-{var_name}); }}")
+        Yields:
+            Consecutive pieces of the CSS string
+        """
+        tokens = tokens or self.tokens
+        if not tokens:
+            return
 
-        lines.append("")
+        # Google Fonts import
+        fonts_import = self._generate_google_fonts_import(tokens.fonts)
+        if fonts_import:
+            yield f"{fonts_import}\n\n"
+
+        # CSS custom properties; sections without tokens are left out
+        yield ":root {\n"
+        if tokens.colors:
+            yield "  /* Colors */\n"
+            for color in tokens.colors:
+                yield f"  {color.to_css_variable()}\n"
+            yield "\n"
+        if tokens.fonts:
+            yield "  /* Typography */\n"
+            for font in tokens.fonts:
+                yield f"  {font.to_css_variable()}\n"
+            yield "\n"
+        if tokens.spacing:
+            yield "  /* Spacing */\n"
+            for spacing in tokens.spacing:
+                yield f"  {spacing.to_css_variable()}\n"
+            yield "\n"
+        yield f"  /* Layout */\n  --container-width: {tokens.container_width}px;\n}}\n"
+
+        # Utility classes for colors, one pre-formatted chunk per token
+        if tokens.colors:
+            yield "\n/* Color utility classes */\n"
+            for color in tokens.colors:
+                slug = color.slug
+                yield (
+                    f".text-{slug} {{ color: var(--color-{slug}); }}\n"
+                    f".bg-{slug} {{ background-color: var(--color-{slug}); }}\n"
+                    f".border-{slug} {{ border-color: var(--color-{slug}); }}\n"
+                )
 
         # Typography utility classes
-        lines.append("/* Typography utility classes */")
-        for font in tokens.fonts:
-            var_name = font.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f".font-{var_name} {{ font-family: var(--font-{var_name}); }}")
-
-        lines.append("")
+        if tokens.fonts:
+            yield "\n/* Typography utility classes */\n"
+            for font in tokens.fonts:
+                slug = font.slug
+                yield f".font-{slug} {{ font-family: var(--font-{slug}); }}\n"
 
         # Spacing utility classes
-        lines.append("/* Spacing utility classes */")
-        for spacing in tokens.spacing:
-            var_name = spacing.name.lower().replace(" ", "-")
-            lines.append(f".m-{var_name} {{ margin: var(--spacing-{var_name}); }}")
-            lines.append(f".p-{var_name} {{ padding: var(--spacing-{var_name}); }}")
-            lines.append(f".mt-{var_name} {{ margin-top: var(--spacing-{var_name}); }}")
-            lines.append(f".mb-{var_name} {{ margin-bottom: var(--spacing-{var_name}); }}")
-            lines.append(f".pt-{var_name} {{ padding-top: var(--spacing-{var_name}); }}")
-            lines.append(f".pb-{var_name} {{ padding-bottom: var(--spacing-{var_name}); }}")
-
-        lines.append("")
+        if tokens.spacing:
+            yield "\n/* Spacing utility classes */\n"
+            for spacing in tokens.spacing:
+                slug = spacing.slug
+                yield (
+                    f".m-{slug} {{ margin: var(--spacing-{slug}); }}\n"
+                    f".p-{slug} {{ padding: var(--spacing-{slug}); }}\n"
+                    f".mt-{slug} {{ margin-top: var(--spacing-{slug}); }}\n"
+                    f".mb-{slug} {{ margin-bottom: var(--spacing-{slug}); }}\n"
+                    f".pt-{slug} {{ padding-top: var(--spacing-{slug}); }}\n"
+                    f".pb-{slug} {{ padding-bottom: var(--spacing-{slug}); }}\n"
+                )
 
         # Container
-        lines.append("/* Container */")
-        lines.append(".container-custom {")
-        lines.append("  width: 100%;")
-        lines.append("  max-width: var(--container-width);")
-        lines.append("  margin-left: auto;")
-        lines.append("  margin-right: auto;")
-        lines.append("  padding-left: 15px;")
-        lines.append("  padding-right: 15px;")
-        lines.append("}")
-        lines.append("")
+        yield "\n"
+        yield _CONTAINER_CSS
 
         # Custom CSS passthrough
         if tokens.custom_css:
-            lines.append("/* Custom CSS from Elementor */")
-            lines.append(tokens.custom_css)
-            lines.append("")
+            yield f"\n/* Custom CSS from Elementor */\n{tokens.custom_css}\n"
 
-        return "\n".join(lines)
+    def _render_css(self, tokens: DesignTokens) -> str:
+        return "".join(self.iter_css(tokens))
 
     def to_scss(self, tokens: Optional[DesignTokens] = None) -> str:
         """
@@ -293,45 +406,35 @@ class StylesConverter:
         tokens = tokens or self.tokens
         if not tokens:
             return ""
-
-        lines = []
+        return self._cached_output("scss", tokens, self._render_scss)
+
+    def _render_scss(self, tokens: DesignTokens) -> str:
+        # Each block is one join; entries carry their leading newline so the
+        # section headers need no separate appends.
+        colors = "".join([f"\n$color-{color.slug}: {color.value};" for color in tokens.colors])
+        fonts = "".join([
+            f"\n$font-{font.slug}: '{font.family}', sans-serif;" for font in tokens.fonts
+        ])
+        spacing = "".join([
+            f"\n$spacing-{spacing.slug}: {spacing.value}{spacing.unit};"
+            for spacing in tokens.spacing
+        ])
+        color_map = "".join([
+            f'\n  "{slug}": $color-{slug},' for slug in [color.slug for color in tokens.colors]
+        ])
+        scss = (
+            f"// Colors{colors}\n"
+            f"\n// Typography{fonts}\n"
+            f"\n// Spacing{spacing}\n"
+            f"\n// Layout\n$container-width: {tokens.container_width}px;\n"
+            f"\n// Color map for utilities\n$colors: ({color_map}\n);"
+        )
 
         # Google Fonts import
         fonts_import = self._generate_google_fonts_import(tokens.fonts)
         if fonts_import:
-            lines.append(fonts_import)
-            lines.append("")
-
-        lines.append("// Colors")
-        for color in tokens.colors:
-            var_name = color.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f"$color-{var_name}: {color.value};")
-
-        lines.append("")
-        lines.append("// Typography")
-        for font in tokens.fonts:
-            var_name = font.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f"$font-{var_name}: '{font.family}', sans-serif;")
-
-        lines.append("")
-        lines.append("// Spacing")
-        for spacing in tokens.spacing:
-            var_name = spacing.name.lower().replace(" ", "-")
-            lines.append(f"$spacing-{var_name}: {spacing.value}{spacing.unit};")
-
-        lines.append("")
-        lines.append("// Layout")
-        lines.append(f"$container-width: {tokens.container_width}px;")
-
-        lines.append("")
-        lines.append("// Color map for utilities")
-        lines.append("$colors: (")
-        for color in tokens.colors:
-            var_name = color.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f'  "{var_name}": $color-{var_name},')
-        lines.append(");")
-
-        return "\n".join(lines)
+            return f"{fonts_import}\n\n{scss}"
+        return scss
 
     def to_tailwind_config(self, tokens: Optional[DesignTokens] = None) -> str:
         """
@@ -346,43 +449,27 @@ class StylesConverter:
         tokens = tokens or self.tokens
         if not tokens:
             return "{}"
-
-        lines = []
-        lines.append("module.exports = {")
-        lines.append("  theme: {")
-        lines.append("    extend: {")
-
-        # Colors
-        lines.append("      colors: {")
-        for color in tokens.colors:
-            var_name = color.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f"        '{var_name}': '{color.value}',")
-        lines.append("      },")
-
-        # Font families
-        lines.append("      fontFamily: {")
-        for font in tokens.fonts:
-            var_name = font.name.lower().replace(" ", "-").replace("_", "-")
-            lines.append(f"        '{var_name}': ['{font.family}', 'sans-serif'],")
-        lines.append("      },")
-
-        # Spacing
-        lines.append("      spacing: {")
-        for spacing in tokens.spacing:
-            var_name = spacing.name.lower().replace(" ", "-")
-            lines.append(f"        '{var_name}': '{spacing.value}{spacing.unit}',")
-        lines.append("      },")
-
-        # Container
-        lines.append("      maxWidth: {")
-        lines.append(f"        'container': '{tokens.container_width}px',")
-        lines.append("      },")
-
-        lines.append("    },")
-        lines.append("  },")
-        lines.append("};")
-
-        return "\n".join(lines)
+        return self._cached_output("tailwind", tokens, self._render_tailwind)
+
+    def _render_tailwind(self, tokens: DesignTokens) -> str:
+        # The config is plain data, so let json serialize it in one pass; JSON
+        # is valid JavaScript and handles quoting of names and values.
+        config = {
+            "theme": {
+                "extend": {
+                    "colors": {color.slug: color.value for color in tokens.colors},
+                    "fontFamily": {
+                        font.slug: [font.family, "sans-serif"] for font in tokens.fonts
+                    },
+                    "spacing": {
+                        spacing.slug: f"{spacing.value}{spacing.unit}"
+                        for spacing in tokens.spacing
+                    },
+                    "maxWidth": {"container": f"{tokens.container_width}px"},
+                },
+            },
+        }
+        return "module.exports = " + json.dumps(config, indent=2, ensure_ascii=False) + ";"
 
     def to_bootstrap_overrides(self, tokens: Optional[DesignTokens] = None) -> str:
         """
@@ -397,88 +484,94 @@ class StylesConverter:
         tokens = tokens or self.tokens
         if not tokens:
             return ""
+        return self._cached_output("bootstrap", tokens, self._render_bootstrap)
 
-        lines = []
-        lines.append("// Bootstrap variable overrides")
-        lines.append("// Import this file BEFORE Bootstrap's variables.scss")
-        lines.append("")
+    def _render_bootstrap(self, tokens: DesignTokens) -> str:
+        lines = [
+            "// Bootstrap variable overrides\n"
+            "// Import this file BEFORE Bootstrap's variables.scss\n"
+        ]
 
         # Map colors to Bootstrap's naming convention
-        color_mapping = {
-            "primary": "$primary",
-            "secondary": "$secondary",
-            "text": "$body-color",
-            "accent": "$info",
-        }
-
-        for color in tokens.colors:
-            category = color.category
-            if category in color_mapping:
-                lines.append(f"{color_mapping[category]}: {color.value};")
-
+        color_mapping = self.BOOTSTRAP_COLOR_VARIABLES
+        lines.extend([
+            f"{color_mapping[color.category]}: {color.value};"
+            for color in tokens.colors
+            if color.category in color_mapping
+        ])
         lines.append("")
 
         # Typography
         if tokens.fonts:
-            primary_font = tokens.fonts[0] if tokens.fonts else None
-            if primary_font:
-                lines.append(f'$font-family-base: "{primary_font.family}", sans-serif;')
+            lines.append(f'$font-family-base: "{tokens.fonts[0].family}", sans-serif;')
 
-        lines.append("")
-        lines.append(f"$container-max-widths: (")
-        lines.append(f"  xl: {tokens.container_width}px")
-        lines.append(");")
+        lines.append(f"\n$container-max-widths: (\n  xl: {tokens.container_width}px\n);")
 
         return "\n".join(lines)
 
+    def _cached_output(
+        self, output_format: str, tokens: DesignTokens, render: Callable[[DesignTokens], str]
+    ) -> str:
+        """Return ``render(tokens)``, reusing output for an identical token set.
+
+        The cache is process-wide: it lives on the class, is shared by every
+        converter instance and thread, and is guarded by a lock.
+        """
+        key = _tokens_fingerprint(tokens)
+        if key is None:
+            return render(tokens)
+
+        # Output is a pure function of the tokens, so batch conversions that
+        # share site settings reuse it.
+        key = (type(self), output_format, key)
+        cache = self._output_cache
+        with self._output_cache_lock:
+            output = cache.get(key)
+            if output is not None:
+                cache.move_to_end(key)
+                return output
+
+        output = render(tokens)
+        with self._output_cache_lock:
+            cache[key] = output
+            cache.move_to_end(key)
+            while len(cache) > _OUTPUT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return output
+
     def _generate_google_fonts_import(self, fonts: List[FontToken]) -> str:
         """Generate Google Fonts import URL."""
         if not fonts:
             return ""
 
-        families = []
-        for font in fonts:
-            family_encoded = font.family.replace(" ", "+")
-            families.append(f"{family_encoded}:wght@{font.weight}")
-
-        if families:
-            families_param = "&family=".join(families)
-            return f'@import url("https://fonts.googleapis.com/css2?family={families_param}&display=swap");'
-
-        return ""
+        # Several tokens often share a family and weight; request each once.
+        families_param = "&family=".join(dict.fromkeys([
+            f"{font.family.replace(' ', '+')}:wght@{font.weight}" for font in fonts
+        ]))
+        return (
+            '@import url("https://fonts.googleapis.com/css2?family='
+            f'{families_param}&display=swap");'
+        )
 
     def _categorize_color(self, key: str) -> str:
         """Categorize a color based on its key."""
-        key_lower = key.lower()
-        if "primary" in key_lower:
-            return "primary"
-        elif "secondary" in key_lower:
-            return "secondary"
-        elif "text" in key_lower or "body" in key_lower:
-            return "text"
-        elif "accent" in key_lower:
-            return "accent"
-        return "primary"
+        return _color_category(key)
+
+    def _extract_size_parts(self, value: Any) -> Tuple[str, str, str]:
+        """Split a size value into (numeric, unit, combined) with one type check.
 
-    def _extract_size(self, value: Any) -> str:
-        """Extract size value from various formats."""
+        ``combined`` is empty when no size is set; ``numeric`` falls back to "0".
+        """
+        if type(value) is str:
+            # Already formatted (e.g. "16px"); skip the dict check and str().
+            return value or "0", "px", value
         if isinstance(value, dict):
             size = value.get("size", "")
             unit = value.get("unit", "px")
-            return f"{size}{unit}" if size else ""
-        return str(value) if value else ""
-
-    def _extract_size_value(self, value: Any) -> str:
-        """Extract just the numeric size value."""
-        if isinstance(value, dict):
-            return str(value.get("size", "0"))
-        return str(value) if value else "0"
-
-    def _extract_size_unit(self, value: Any) -> str:
-        """Extract just the unit from a size value."""
-        if isinstance(value, dict):
-            return value.get("unit", "px")
-        return "px"
+            numeric = str(size) if "size" in value else "0"
+            return numeric, unit, f"{size}{unit}" if size else ""
+        combined = str(value) if value else ""
+        return combined or "0", "px", combined
 
 
 def extract_and_convert_styles(
@@ -11,14 +11,110 @@ Supports output formats:
 - Handlebars partials (JavaScript frameworks)
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 import re
 
+from .._compat import DATACLASS_OPTIONS
 from .bootstrap import BootstrapConverter
 
 
-@dataclass
+# Stand-in markup the Bootstrap converter emits for dynamic widgets.
+_SITE_LOGO_RE = re.compile(r'<a href="/" class="navbar-brand">Site Logo</a>')
+_NAV_MENU_COMMENT_RE = re.compile(r'<!-- Menu items would be populated from WordPress menu -->')
+
+# Placeholder markers left in converted HTML, captured by name.
+_PLACEHOLDER_PREFIX = "<!-- PLACEHOLDER: "
+_PLACEHOLDER_RE = re.compile(r"<!-- PLACEHOLDER: (\w+) -->")
+
+# WordPress template tags for placeholders in PHP output.
+_PHP_FUNCTIONS: Mapping[str, str] = MappingProxyType({
+    "site_title": "<?php bloginfo('name'); ?>",
+    "site_description": "<?php bloginfo('description'); ?>",
+    "site_url": "<?php echo home_url(); ?>",
+    "site_logo": "<?php the_custom_logo(); ?>",
+    "nav_menu": "<?php wp_nav_menu(array('theme_location' => 'primary')); ?>",
+    "search_form": "<?php get_search_form(); ?>",
+    "year": "<?php echo date('Y'); ?>",
+})
+
+# Base layouts for TemplatePartGenerator.generate_base_layout, filled with
+# %-style fields so the Jinja2 and PHP syntax needs no brace escaping.
+_HTML_LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>%(title)s - %(site_name)s</title>
+  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
+  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
+  <link rel="stylesheet" href="assets/styles.css">
+</head>
+<body>
+%(header_html)s
+
+<main class="site-content">
+  <!-- Page content here -->
+</main>
+
+%(footer_html)s
+
+<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>
+</body>
+</html>"""
+
+_JINJA2_LAYOUT = """{%% extends "base.html" %%}
+
+{%% block head %%}
+<title>{{ page.title }} - {{ site.name }}</title>
+<link rel="stylesheet" href="{{ '/assets/styles.css' | url }}">
+{%% endblock %%}
+
+{%% block header %%}
+%(header_html)s
+{%% endblock %%}
+
+{%% block content %%}
+<!-- Page content injected here -->
+{{ content }}
+{%% endblock %%}
+
+{%% block footer %%}
+%(footer_html)s
+{%% endblock %%}"""
+
+_PHP_LAYOUT = """<!DOCTYPE html>
+<html <?php language_attributes(); ?>>
+<head>
+  <meta charset="<?php bloginfo('charset'); ?>">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <?php wp_head(); ?>
+</head>
+<body <?php body_class(); ?>>
+<?php wp_body_open(); ?>
+
+%(header_html)s
+
+<main class="site-content">
+  <?php
+  if (have_posts()) :
+    while (have_posts()) : the_post();
+      the_content();
+    endwhile;
+  endif;
+  ?>
+</main>
+
+%(footer_html)s
+
+<?php wp_footer(); ?>
+</body>
+</html>"""
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class DynamicPlaceholder:
     """Represents a dynamic content placeholder."""
 
@@ -37,19 +133,10 @@ class DynamicPlaceholder:
 
     def to_php(self) -> str:
         """Convert to PHP syntax."""
-        php_functions = {
-            "site_title": "<?php bloginfo('name'); ?>",
-            "site_description": "<?php bloginfo('description'); ?>",
-            "site_url": "<?php echo home_url(); ?>",
-            "site_logo": "<?php the_custom_logo(); ?>",
-            "nav_menu": "<?php wp_nav_menu(array('theme_location' => 'primary')); ?>",
-            "search_form": "<?php get_search_form(); ?>",
-            "year": "<?php echo date('Y'); ?>",
-        }
-        return php_functions.get(self.name, f"<?php /* {self.name} */ ?>")
+        return _PHP_FUNCTIONS.get(self.name, f"<?php /* {self.name} */ ?>")
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TemplatePartConfig:
     """Configuration for template part output."""
 
@@ -125,7 +212,8 @@ class TemplateConverter:
     def __init__(self, config: Optional[TemplatePartConfig] = None):
         self.config = config or TemplatePartConfig()
         self.bootstrap_converter = BootstrapConverter(include_metadata=False)
-        self.dynamic_placeholders: List[DynamicPlaceholder] = []
+        # Placeholders found in the current template, by name (first widget wins).
+        self.dynamic_placeholders: Dict[str, DynamicPlaceholder] = {}
 
     def convert_header(self, template_data: Dict[str, Any]) -> str:
         """
@@ -193,16 +281,18 @@ class TemplateConverter:
         Returns:
             Converted template string
         """
-        self.dynamic_placeholders = []
+        # Per-call state stays local; self.dynamic_placeholders is only
+        # published once the template is converted.
+        placeholders: Dict[str, DynamicPlaceholder] = {}
 
-        # Pre-process to mark dynamic widgets
-        processed_data = self._preprocess_dynamic_widgets(template_data)
-
-        # Convert using Bootstrap converter
-        html = self.bootstrap_converter.convert_fragment(processed_data)
+        # Convert using Bootstrap converter, recording dynamic widgets on the way
+        html = self.bootstrap_converter.convert_fragment(
+            template_data, widget_hook=partial(self._record_dynamic_widget, placeholders)
+        )
 
         # Post-process dynamic placeholders based on output format
-        html = self._postprocess_placeholders(html)
+        html = self._postprocess_placeholders(html, placeholders)
+        self.dynamic_placeholders = placeholders
 
         # Add wrapper if configured
         if self.config.include_wrapper:
@@ -210,90 +300,74 @@ class TemplateConverter:
 
         return html
 
-    def _preprocess_dynamic_widgets(self, data: Any) -> Any:
+    def _record_dynamic_widget(
+        self, placeholders: Dict[str, DynamicPlaceholder], element: Dict[str, Any]
+    ) -> None:
         """
-        Pre-process data to mark dynamic widgets for special handling.
+        Record the placeholder for a dynamic widget met during conversion.
 
         Args:
-            data: Elementor JSON data
-
-        Returns:
-            Processed data with dynamic widget markers
+            placeholders: Placeholders found so far, by name (first wins)
+            element: Widget element, passed in document order by the
+                Bootstrap converter's widget hook
         """
-        if isinstance(data, dict):
-            widget_type = data.get("widgetType", "")
-
-            if widget_type in self.DYNAMIC_WIDGET_MAP:
-                # Record the placeholder
-                placeholder = self.DYNAMIC_WIDGET_MAP[widget_type]
-                self.dynamic_placeholders.append(placeholder)
-
-                # Replace with placeholder marker
-                data = dict(data)
-                data["_dynamic_placeholder"] = placeholder.name
-                data["_dynamic_default"] = placeholder.default_value
-
-            # Process children
-            if "elements" in data:
-                data["elements"] = [
-                    self._preprocess_dynamic_widgets(el)
-                    for el in data["elements"]
-                ]
-            if "settings" in data:
-                data["settings"] = self._preprocess_dynamic_widgets(data["settings"])
-
-            return data
-
-        elif isinstance(data, list):
-            return [self._preprocess_dynamic_widgets(item) for item in data]
-
-        return data
-
-    def _postprocess_placeholders(self, html: str) -> str:
+        widget_type = element.get("widgetType")
+        # Most widgets are not dynamic; one map probe settles it.
+        placeholder = self.DYNAMIC_WIDGET_MAP.get(widget_type) if widget_type else None
+        if placeholder is not None:
+            placeholders.setdefault(placeholder.name, placeholder)
+
+    def _postprocess_placeholders(
+        self, html: str, placeholders: Dict[str, DynamicPlaceholder]
+    ) -> str:
         """
         Replace placeholder markers with format-specific syntax.
 
         Args:
             html: HTML with placeholder markers
+            placeholders: Placeholders found in the template, by name
 
         Returns:
             HTML with proper placeholder syntax
         """
-        for placeholder in self.dynamic_placeholders:
-            marker = f"<!-- PLACEHOLDER: {placeholder.name} -->"
-
-            if self.config.format == "jinja2":
-                replacement = placeholder.to_jinja2()
-            elif self.config.format == "php":
-                replacement = placeholder.to_php()
-            elif self.config.format == "handlebars":
-                replacement = f"{{{{ {placeholder.name} }}}}"
-            else:
-                # HTML - use default value or comment
-                if self.config.preserve_dynamic:
-                    replacement = f"<!-- DYNAMIC: {placeholder.name} -->\n{placeholder.default_value}"
-                else:
-                    replacement = placeholder.default_value
-
-            # Replace any existing markers
-            html = html.replace(marker, replacement)
-
-            # Also replace any Site Logo / nav-menu placeholders from Bootstrap converter
-            if placeholder.name == "site_logo":
-                html = re.sub(
-                    r'<a href="/" class="navbar-brand">Site Logo</a>',
-                    replacement,
-                    html
-                )
-            elif placeholder.name == "nav_menu":
-                html = re.sub(
-                    r'<!-- Menu items would be populated from WordPress menu -->',
-                    replacement if self.config.preserve_dynamic else "",
-                    html
-                )
+        replacements = {
+            name: self._placeholder_replacement(placeholder)
+            for name, placeholder in placeholders.items()
+        }
+        if not replacements:
+            return html
+
+        # Replace every known marker in one scan; unknown markers stay as-is.
+        # Converted markup rarely carries markers, so a plain substring test
+        # usually lets us skip the regex pass entirely.
+        if _PLACEHOLDER_PREFIX in html:
+            html = _PLACEHOLDER_RE.sub(
+                lambda match: replacements.get(match.group(1), match.group(0)), html
+            )
+
+        # Also replace any Site Logo / nav-menu placeholders from Bootstrap converter
+        if "site_logo" in replacements:
+            html = _SITE_LOGO_RE.sub(replacements["site_logo"], html)
+        if "nav_menu" in replacements:
+            html = _NAV_MENU_COMMENT_RE.sub(
+                replacements["nav_menu"] if self.config.preserve_dynamic else "", html
+            )
 
         return html
 
+    def _placeholder_replacement(self, placeholder: DynamicPlaceholder) -> str:
+        """Return the format-specific markup that stands in for a placeholder."""
+        if self.config.format == "jinja2":
+            return placeholder.to_jinja2()
+        elif self.config.format == "php":
+            return placeholder.to_php()
+        elif self.config.format == "handlebars":
+            return f"{{{{ {placeholder.name} }}}}"
+        # HTML - use default value or comment
+        if self.config.preserve_dynamic:
+            return f"<!-- DYNAMIC: {placeholder.name} -->\n{placeholder.default_value}"
+        return placeholder.default_value
+
     def _add_wrapper(self, html: str) -> str:
         """
         Add semantic wrapper element around template content.
@@ -366,7 +440,7 @@ class TemplateConverter:
             "",
         ])
 
-        for placeholder in self.dynamic_placeholders:
+        for placeholder in self.dynamic_placeholders.values():
             lines.append(f"- **{placeholder.name}**: {placeholder.elementor_type}")
 
         return "\n".join(lines)
@@ -386,38 +460,44 @@ class TemplatePartGenerator:
 
     def generate_all(
         self,
-        templates: List[Dict[str, Any]]
+        templates: List[Dict[str, Any]],
+        writer: Optional[Callable[[str, str], None]] = None,
     ) -> Dict[str, str]:
         """
         Generate all template parts from a list of templates.
 
         Args:
             templates: List of template data dicts with 'type' and 'content' keys
+            writer: Optional callable taking (name, content). When given, each
+                part is handed to it as soon as it is converted instead of
+                being kept, so only one part is held in memory at a time.
 
         Returns:
-            Dict mapping template names to converted content
+            Dict mapping template names to converted content (empty when a
+            writer is given)
         """
-        output = {}
+        output: Dict[str, str] = {}
+        emit = writer if writer is not None else output.__setitem__
 
         for template in templates:
             template_type = template.get("type", "unknown")
             template_data = template.get("document", template.get("content", {}))
 
             if template_type == "header":
-                output["header.html"] = self.converter.convert_header(template_data)
+                emit("header.html", self.converter.convert_header(template_data))
             elif template_type == "footer":
-                output["footer.html"] = self.converter.convert_footer(template_data)
+                emit("footer.html", self.converter.convert_footer(template_data))
             elif template_type == "sidebar":
-                output["sidebar.html"] = self.converter.convert_sidebar(template_data)
+                emit("sidebar.html", self.converter.convert_sidebar(template_data))
             elif template_type == "single":
-                output["single.html"] = self.converter.convert_single(template_data)
+                emit("single.html", self.converter.convert_single(template_data))
             elif template_type == "archive":
                 self.converter.config.wrapper_tag = "main"
                 self.converter.config.wrapper_classes = ["archive-content"]
-                output["archive.html"] = self.converter._convert_template(template_data)
+                emit("archive.html", self.converter._convert_template(template_data))
 
         # Generate documentation
-        output["README.md"] = self.converter.generate_includes_documentation()
+        emit("README.md", self.converter.generate_includes_documentation())
 
         return output
 
@@ -455,28 +535,12 @@ class TemplatePartGenerator:
         site_name: str
     ) -> str:
         """Generate plain HTML layout."""
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{title} - {site_name}</title>
-  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
-  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
-  <link rel="stylesheet" href="assets/styles.css">
-</head>
-<body>
-{header_html}
-
-<main class="site-content">
-  <!-- Page content here -->
-</main>
-
-{footer_html}
-
-<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>"""
+        return _HTML_LAYOUT % {
+            "title": title,
+            "site_name": site_name,
+            "header_html": header_html,
+            "footer_html": footer_html,
+        }
 
     def _generate_jinja2_layout(
         self,
@@ -486,25 +550,12 @@ class TemplatePartGenerator:
         site_name: str
     ) -> str:
         """Generate Jinja2 layout template."""
-        return f"""{{% extends "base.html" %}}
-
-{{% block head %}}
-<title>{{{{ page.title }}}} - {{{{ site.name }}}}</title>
-<link rel="stylesheet" href="{{{{ '/assets/styles.css' | url }}}}">
-{{% endblock %}}
-
-{{% block header %}}
-{header_html}
-{{% endblock %}}
-
-{{% block content %}}
-<!-- Page content injected here -->
-{{{{ content }}}}
-{{% endblock %}}
-
-{{% block footer %}}
-{footer_html}
-{{% endblock %}}"""
+        return _JINJA2_LAYOUT % {
+            "title": title,
+            "site_name": site_name,
+            "header_html": header_html,
+            "footer_html": footer_html,
+        }
 
     def _generate_php_layout(
         self,
@@ -514,30 +565,9 @@ class TemplatePartGenerator:
         site_name: str
     ) -> str:
         """Generate PHP layout template."""
-        return f"""<!DOCTYPE html>
-<html <?php language_attributes(); ?>>
-<head>
-  <meta charset="<?php bloginfo('charset'); ?>">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <?php wp_head(); ?>
-</head>
-<body <?php body_class(); ?>>
-<?php wp_body_open(); ?>
-
-{header_html}
-
-<main class="site-content">
-  <?php
-  if (have_posts()) :
-    while (have_posts()) : the_post();
-      the_content();
-    endwhile;
-  endif;
-  ?>
-</main>
-
-{footer_html}
-
-<?php wp_footer(); ?>
-</body>
-</html>"""
+        return _PHP_LAYOUT % {
+            "title": title,
+            "site_name": site_name,
+            "header_html": header_html,
+            "footer_html": footer_html,
+        }
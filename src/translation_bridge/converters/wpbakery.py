@@ -5,13 +5,18 @@ Converts universal/parsed data TO WPBakery shortcode format.
 Generates proper shortcode structure: [vc_row][vc_column][vc_element][/vc_column][/vc_row]
 """
 
-from typing import Any, Dict, List
+from bisect import bisect_right
+from typing import Any, Dict, List, Sequence
 from html import escape
 
 
 # Upstream framework version this converter is calibrated against.
 TARGET_CMS_VERSION: str = "8.7.3"
 
+# Newline joiner for f-strings (expressions there cannot contain a backslash
+# before Python 3.12).
+_NL = "\n"
+
 # Setting keys that carry user-visible content (mirrors the fidelity
 # convention in cli.py). Used by the last-resort fallback so unmapped
 # widgets never drop content.
@@ -21,6 +26,29 @@ _CONTENT_KEY_PARTS = (
 )
 
 
+# Column width thresholds (percent) and the WPBakery fraction for each band.
+# Widths below the smallest threshold fall back to a full-width column.
+_WIDTH_THRESH = (25, 33, 50, 66, 75, 100)
+_WIDTH_LABEL = ("1/1", "1/4", "1/3", "1/2", "2/3", "3/4", "1/1")
+
+# Placeholder bodies for structural shortcodes with no children.
+_EMPTY_COLUMN = ('[vc_column][/vc_column]',)
+_EMPTY_INNER_COLUMN = ('[vc_column_inner][/vc_column_inner]',)
+
+
+def _shortcode_block(opening: str, body: Sequence[str], closing: str) -> str:
+    """Join an opening tag, body lines and closing tag with one allocation.
+
+    An empty body still leaves a blank line between the tags.
+    """
+    return "\n".join([opening, *(body or ("",)), closing])
+
+
+def _attr_value(value: Any) -> str:
+    """Stringify and escape a shortcode attribute value."""
+    return escape(value if type(value) is str else str(value))
+
+
 def _is_content_key(key: str) -> bool:
     key_lower = key.lower()
     return any(part in key_lower for part in _CONTENT_KEY_PARTS)
@@ -87,6 +115,62 @@ class WPBakeryConverter:
         "alert": "vc_message",
     }
 
+    # Top-level elType -> converter; anything else is a generic component.
+    # Top-level columns become rows of their own, like sections.
+    ELEMENT_CONVERTERS: Dict[str, str] = {
+        "section": "_convert_section",
+        "container": "_convert_section",
+        "column": "_convert_section",
+        "widget": "_convert_top_level_widget",
+    }
+
+    # Canonical widget type -> builder for widgets rendered as composite
+    # vc_column_text markup; checked before ELEMENT_TYPE_MAP.
+    COMPOSITE_BUILDERS: Dict[str, str] = {
+        "testimonial": "_build_testimonial",
+        "icon-box": "_build_icon_box",
+        "icon-list": "_build_icon_list",
+        "price-table": "_build_price_table",
+    }
+
+    # WPBakery element -> builder taking only the widget settings.
+    ELEMENT_BUILDERS: Dict[str, str] = {
+        "vc_custom_heading": "_build_heading",
+        "vc_single_image": "_build_image",
+        "vc_btn": "_build_button",
+        "vc_separator": "_build_separator",
+        "vc_empty_space": "_build_empty_space",
+        "vc_icon": "_build_icon",
+        "vc_video": "_build_video",
+        "vc_gallery": "_build_gallery",
+        "vc_tta_tabs": "_build_tabs",
+        "vc_tta_accordion": "_build_accordion",
+        "vc_progress_bar": "_build_progress",
+        "vc_cta": "_build_cta",
+        "vc_message": "_build_alert",
+    }
+
+    # WPBakery element -> builder that also takes the component's content.
+    CONTENT_ELEMENT_BUILDERS: Dict[str, str] = {
+        "vc_column_text": "_build_text",
+        "vc_raw_html": "_build_raw_html",
+    }
+
+    def __init__(self) -> None:
+        self._element_converters = {
+            el_type: getattr(self, name) for el_type, name in self.ELEMENT_CONVERTERS.items()
+        }
+        # Bind each builder once so every widget dispatches with a dict probe.
+        self._composite_builders = {
+            comp_type: getattr(self, name) for comp_type, name in self.COMPOSITE_BUILDERS.items()
+        }
+        self._element_builders = {
+            element: getattr(self, name) for element, name in self.ELEMENT_BUILDERS.items()
+        }
+        self._content_builders = {
+            element: getattr(self, name) for element, name in self.CONTENT_ELEMENT_BUILDERS.items()
+        }
+
     def convert(self, data: Any) -> str:
         """Convert universal data to WPBakery shortcode string."""
         if isinstance(data, dict):
@@ -101,20 +185,22 @@ class WPBakeryConverter:
 
     def _convert_elements(self, elements: List[Dict[str, Any]]) -> str:
         """Convert list of elements to shortcodes."""
+        converters = self._element_converters
         rows = []
 
         for element in elements:
-            el_type = element.get("elType", "")
-
-            if el_type in ("section", "container", "column"):
-                rows.append(self._convert_section(element))
-            elif el_type == "widget":
-                rows.append(self._wrap_in_row(self._convert_widget(element)))
+            converter = converters.get(element.get("elType", ""))
+            if converter is not None:
+                rows.append(converter(element))
             else:
                 rows.append(self._wrap_in_row(self._convert_component(element)))
 
         return "\n\n".join(rows)
 
+    def _convert_top_level_widget(self, widget: Dict[str, Any]) -> str:
+        """Convert a widget with no structural parent into its own row."""
+        return self._wrap_in_row(self._convert_widget(widget))
+
     def _convert_section(self, section: Dict[str, Any]) -> str:
         """Convert a structural element to one or more vc_row blocks."""
         settings = section.get("settings", {})
@@ -141,12 +227,13 @@ class WPBakeryConverter:
 
         if loose:
             # Widgets without a column wrapper get a default full-width column.
-            columns.append(f'[vc_column]\n{chr(10).join(loose)}\n[/vc_column]')
+            columns.append(_shortcode_block('[vc_column]', loose, '[/vc_column]'))
 
         rows = []
         if columns or not nested_rows:
-            inner = "\n".join(columns) if columns else '[vc_column][/vc_column]'
-            rows.append(f'[vc_row{attrs_str}]\n{inner}\n[/vc_row]')
+            rows.append(_shortcode_block(
+                f'[vc_row{attrs_str}]', columns or _EMPTY_COLUMN, '[/vc_row]'
+            ))
         rows.extend(nested_rows)
 
         return "\n\n".join(rows)
@@ -173,8 +260,7 @@ class WPBakeryConverter:
             else:
                 widgets.append(self._convert_component(child))
 
-        content = "\n".join(widgets)
-        return f'[{tag}{attrs_str}]\n{content}\n[/{tag}]'
+        return _shortcode_block(f'[{tag}{attrs_str}]', widgets, f'[/{tag}]')
 
     def _convert_inner_row(self, element: Dict[str, Any]) -> str:
         """Convert a structural element nested inside a column to vc_row_inner."""
@@ -194,10 +280,11 @@ class WPBakeryConverter:
                 loose.append(self._convert_component(child))
 
         if loose:
-            inner_cols.append(f'[vc_column_inner]\n{chr(10).join(loose)}\n[/vc_column_inner]')
+            inner_cols.append(_shortcode_block('[vc_column_inner]', loose, '[/vc_column_inner]'))
 
-        inner = "\n".join(inner_cols) if inner_cols else '[vc_column_inner][/vc_column_inner]'
-        return f'[vc_row_inner]\n{inner}\n[/vc_row_inner]'
+        return _shortcode_block(
+            '[vc_row_inner]', inner_cols or _EMPTY_INNER_COLUMN, '[/vc_row_inner]'
+        )
 
     def _convert_widget(self, widget: Dict[str, Any]) -> str:
         """Convert widget to WPBakery element."""
@@ -223,52 +310,33 @@ class WPBakeryConverter:
         """Build WPBakery element shortcode."""
         # Canonical widgets with no 1:1 WPBakery element are built as
         # composite markup so no content-bearing setting is dropped.
-        if comp_type == "testimonial":
-            return self._build_testimonial(settings)
-        elif comp_type == "icon-box":
-            return self._build_icon_box(settings)
-        elif comp_type == "icon-list":
-            return self._build_icon_list(settings)
-        elif comp_type == "price-table":
-            return self._build_price_table(settings)
+        builder = self._composite_builders.get(comp_type)
+        if builder is not None:
+            return builder(settings)
 
         element_name = self.ELEMENT_TYPE_MAP.get(comp_type, "")
-
-        if element_name == "vc_custom_heading":
-            return self._build_heading(settings)
-        elif element_name == "vc_column_text":
-            return self._build_text(settings, content)
-        elif element_name == "vc_single_image":
-            return self._build_image(settings)
-        elif element_name == "vc_btn":
-            return self._build_button(settings)
-        elif element_name == "vc_separator":
-            return '[vc_separator]'
-        elif element_name == "vc_empty_space":
-            height = settings.get("space", {})
-            h = height.get("size", 32) if isinstance(height, dict) else 32
-            return f'[vc_empty_space height="{h}px"]'
-        elif element_name == "vc_icon":
-            return self._build_icon(settings)
-        elif element_name == "vc_video":
-            return self._build_video(settings)
-        elif element_name == "vc_gallery":
-            return self._build_gallery(settings)
-        elif element_name == "vc_tta_tabs":
-            return self._build_tabs(settings)
-        elif element_name == "vc_tta_accordion":
-            return self._build_accordion(settings)
-        elif element_name == "vc_progress_bar":
-            return self._build_progress(settings)
-        elif element_name == "vc_raw_html":
-            html = content or settings.get("html", "")
-            return f'[vc_raw_html]{html}[/vc_raw_html]'
-        elif element_name == "vc_cta":
-            return self._build_cta(settings)
-        elif element_name == "vc_message":
-            return self._build_alert(settings)
-        else:
-            return self._build_fallback(settings, content)
+        builder = self._element_builders.get(element_name)
+        if builder is not None:
+            return builder(settings)
+        builder = self._content_builders.get(element_name)
+        if builder is not None:
+            return builder(settings, content)
+        return self._build_fallback(settings, content)
+
+    def _build_separator(self, settings: Dict[str, Any]) -> str:
+        """Build vc_separator shortcode."""
+        return '[vc_separator]'
+
+    def _build_empty_space(self, settings: Dict[str, Any]) -> str:
+        """Build vc_empty_space shortcode."""
+        height = settings.get("space", {})
+        h = height.get("size", 32) if isinstance(height, dict) else 32
+        return f'[vc_empty_space height="{h}px"]'
+
+    def _build_raw_html(self, settings: Dict[str, Any], content: str = "") -> str:
+        """Build vc_raw_html shortcode."""
+        html = content or settings.get("html", "")
+        return f'[vc_raw_html]{html}[/vc_raw_html]'
 
     def _build_heading(self, settings: Dict[str, Any]) -> str:
         """Build vc_custom_heading shortcode."""
@@ -277,13 +345,14 @@ class WPBakeryConverter:
         align = settings.get("align", "")
         color = settings.get("title_color", "")
 
-        attrs = {"text": title, "font_container": f"tag:{tag}"}
+        font_container = f"tag:{tag}"
         if align:
-            attrs["font_container"] += f"|text_align:{align}"
+            font_container += f"|text_align:{align}"
         if color:
-            attrs["font_container"] += f"|color:{color}"
+            font_container += f"|color:{color}"
 
-        return f'[vc_custom_heading{self._attrs_to_string(attrs)}]'
+        text_attr = f' text="{_attr_value(title)}"' if title else ""
+        return f'[vc_custom_heading{text_attr} font_container="{escape(font_container)}"]'
 
     def _build_text(self, settings: Dict[str, Any], content: str = "") -> str:
         """Build vc_column_text shortcode."""
@@ -314,8 +383,8 @@ class WPBakeryConverter:
         link = settings.get("link", {})
         url = link.get("url", "#") if isinstance(link, dict) else "#"
 
-        attrs = {"title": text, "link": f"url:{escape(url)}"}
-        return f'[vc_btn{self._attrs_to_string(attrs)}]'
+        title_attr = f' title="{_attr_value(text)}"' if text else ""
+        return f'[vc_btn{title_attr} link="{escape(f"url:{escape(url)}")}"]'
 
     def _build_icon(self, settings: Dict[str, Any]) -> str:
         """Build vc_icon shortcode."""
@@ -333,12 +402,13 @@ class WPBakeryConverter:
     def _build_gallery(self, settings: Dict[str, Any]) -> str:
         """Build vc_gallery shortcode."""
         gallery = settings.get("wp_gallery") or settings.get("gallery") or []
-        ids = [str(img.get("id", "")) for img in gallery if isinstance(img, dict) and img.get("id")]
-        srcs = [str(img.get("url", "")) for img in gallery if isinstance(img, dict) and img.get("url")]
-
+        srcs = [str(img["url"]) for img in gallery if isinstance(img, dict) and img.get("url")]
         if srcs:
             return f'[vc_gallery type="image_grid" source="external_link" custom_srcs="{escape(",".join(srcs))}"]'
-        return f'[vc_gallery type="image_grid" images="{",".join(ids)}"]'
+
+        # Image IDs are only needed when no external URLs were found.
+        ids = ",".join([str(img["id"]) for img in gallery if isinstance(img, dict) and img.get("id")])
+        return f'[vc_gallery type="image_grid" images="{ids}"]'
 
     def _build_tabs(self, settings: Dict[str, Any]) -> str:
         """Build vc_tta_tabs shortcode."""
@@ -349,7 +419,7 @@ class WPBakeryConverter:
             content = tab.get("tab_content", "")
             tab_items.append(f'[vc_tta_section title="{escape(title)}"]\n[vc_column_text]{content}[/vc_column_text]\n[/vc_tta_section]')
 
-        return f'[vc_tta_tabs]\n{chr(10).join(tab_items)}\n[/vc_tta_tabs]'
+        return _shortcode_block('[vc_tta_tabs]', tab_items, '[/vc_tta_tabs]')
 
     def _build_accordion(self, settings: Dict[str, Any]) -> str:
         """Build vc_tta_accordion shortcode."""
@@ -361,14 +431,14 @@ class WPBakeryConverter:
             active = 'active="true"' if i == 0 else ""
             acc_items.append(f'[vc_tta_section title="{escape(title)}" {active}]\n[vc_column_text]{content}[/vc_column_text]\n[/vc_tta_section]')
 
-        return f'[vc_tta_accordion]\n{chr(10).join(acc_items)}\n[/vc_tta_accordion]'
+        return _shortcode_block('[vc_tta_accordion]', acc_items, '[/vc_tta_accordion]')
 
     def _build_progress(self, settings: Dict[str, Any]) -> str:
         """Build vc_progress_bar shortcode."""
         percent = settings.get("percent", {})
         value = percent.get("size", 50) if isinstance(percent, dict) else (percent or 50)
         title = settings.get("title", "")
-        return f'[vc_progress_bar values="{value}|{escape(str(title))}"]'
+        return f'[vc_progress_bar values="{value}|{_attr_value(title)}"]'
 
     def _build_cta(self, settings: Dict[str, Any]) -> str:
         """Build vc_cta shortcode."""
@@ -378,9 +448,13 @@ class WPBakeryConverter:
         link = settings.get("link", {})
         url = link.get("url", "#") if isinstance(link, dict) else "#"
 
-        attrs = {"h2": title, "txt_align": "center", "add_button": "bottom",
-                 "btn_title": btn_text, "btn_link": f"url:{escape(url)}"}
-        return f'[vc_cta{self._attrs_to_string(attrs)}]{content}[/vc_cta]'
+        h2_attr = f' h2="{_attr_value(title)}"' if title else ""
+        btn_attr = f' btn_title="{_attr_value(btn_text)}"' if btn_text else ""
+        btn_link = escape(f"url:{escape(url)}")
+        return (
+            f'[vc_cta{h2_attr} txt_align="center" add_button="bottom"{btn_attr}'
+            f' btn_link="{btn_link}"]{content}[/vc_cta]'
+        )
 
     def _build_alert(self, settings: Dict[str, Any]) -> str:
         """Build vc_message shortcode."""
@@ -463,7 +537,7 @@ class WPBakeryConverter:
         if content:
             parts.append(content)
         parts.extend(v for v in _collect_content_values(settings) if v not in parts)
-        return f'[vc_column_text]{chr(10).join(parts)}[/vc_column_text]'
+        return f'[vc_column_text]{_NL.join(parts)}[/vc_column_text]'
 
     def _build_row_attrs(self, settings: Dict[str, Any]) -> Dict[str, str]:
         """Build row attributes from settings."""
@@ -479,19 +553,12 @@ class WPBakeryConverter:
 
     def _size_to_wpbakery_width(self, size: int) -> str:
         """Convert size percentage to WPBakery width fraction."""
-        if size >= 100: return "1/1"
-        if size >= 75: return "3/4"
-        if size >= 66: return "2/3"
-        if size >= 50: return "1/2"
-        if size >= 33: return "1/3"
-        if size >= 25: return "1/4"
-        return "1/1"
+        return _WIDTH_LABEL[bisect_right(_WIDTH_THRESH, size)]
 
     def _attrs_to_string(self, attrs: Dict[str, str]) -> str:
         """Convert attributes dict to shortcode attribute string."""
-        if not attrs:
-            return ""
-        return " " + " ".join(f'{k}="{escape(str(v))}"' for k, v in attrs.items() if v)
+        parts = [f'{k}="{_attr_value(v)}"' for k, v in attrs.items() if v]
+        return " " + " ".join(parts) if parts else ""
 
     def get_framework(self) -> str:
         return "wpbakery"
@@ -6,14 +6,43 @@ for transformation via the Zone Theory engine.
 """
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
+from .._compat import DATACLASS_OPTIONS
 from ..transforms.registry import ParserRegistry
 from ..transforms.core import TransformEngine, Zone, ZoneType
 from ..responsive import elementor_v3_settings_to_canonical
 
+try:  # Optional C decoder; see the "fast" extra.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Settings keys checked for translatable text on every element.
+_COMMON_CONTENT_KEYS = ("title", "description", "text", "content", "editor", "heading")
+
+# Shared lookup result for widgets missing from ElementorParser.WIDGET_TYPES.
+_EMPTY_WIDGET_INFO = MappingProxyType({"content_key": None, "type": "text"})
+
+
+def load_json(source: Union[str, bytes]) -> Any:
+    """Decode Elementor JSON, using orjson when it is installed.
+
+    Input orjson rejects (NaN/Infinity, integers wider than 64 bits, a BOM)
+    is handed to the stdlib decoder, so results and errors match json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(source)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(source)
+
 
 def is_atomic_v4_payload(data: Any) -> bool:
     """Detect Elementor 4.x ("Atomic Editor") content.
@@ -42,7 +71,7 @@ def is_atomic_v4_payload(data: Any) -> bool:
     return False
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ElementorElement:
     """Represents a parsed Elementor element."""
 
@@ -56,11 +85,26 @@ class ElementorElement:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
+        # Each node's dict is created before its children, so child dicts can
+        # be appended straight into the parent's "elements" list; no recursion.
+        result = self._node_dict()
+        stack = [(self.elements, result["elements"])]
+        while stack:
+            children, out = stack.pop()
+            for child in children:
+                node = child._node_dict()
+                out.append(node)
+                if child.elements:
+                    stack.append((child.elements, node["elements"]))
+        return result
+
+    def _node_dict(self) -> Dict[str, Any]:
+        """Serialize this element alone, with an empty "elements" list."""
         result = {
             "id": self.id,
             "elType": self.el_type,
             "settings": self.settings,
-            "elements": [el.to_dict() for el in self.elements],
+            "elements": [],
         }
         if self.widget_type:
             result["widgetType"] = self.widget_type
@@ -71,7 +115,7 @@ class ElementorElement:
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ElementorDocument:
     """Represents a parsed Elementor document."""
 
@@ -150,10 +194,7 @@ class ElementorParser:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return self.parse(data)
+        return self.parse(load_json(path.read_bytes()))
 
     def parse(self, data: Any) -> ElementorDocument:
         """
@@ -186,7 +227,17 @@ class ElementorParser:
         else:
             raise ValueError(f"Unexpected data type: {type(data)}")
 
-        elements = [self._parse_element(el) for el in elements_data]
+        # Walk the tree with an explicit stack so deeply nested pages cannot
+        # hit the recursion limit. Children are pushed in reverse so siblings
+        # are attached in document order.
+        elements: List[ElementorElement] = []
+        stack = [(elements, el) for el in reversed(elements_data)]
+        build = self._build_element
+        while stack:
+            parent_list, el_data = stack.pop()
+            element = build(el_data)
+            parent_list.append(element)
+            stack.extend((element.elements, child) for child in reversed(el_data.get("elements", [])))
 
         return ElementorDocument(
             elements=elements,
@@ -195,8 +246,8 @@ class ElementorParser:
             meta=meta,
         )
 
-    def _parse_element(self, data: Dict[str, Any]) -> ElementorElement:
-        """Parse a single Elementor element."""
+    def _build_element(self, data: Dict[str, Any]) -> ElementorElement:
+        """Build a single Elementor element; parse() links its children."""
         settings = data.get("settings", {}) or {}
 
         # Canonicalize _tablet/_mobile/_hover setting suffixes so responsive
@@ -207,7 +258,7 @@ class ElementorParser:
             else None
         )
 
-        element = ElementorElement(
+        return ElementorElement(
             id=data.get("id", data.get("_id", "")),
             el_type=data.get("elType", "widget"),
             widget_type=data.get("widgetType"),
@@ -216,12 +267,6 @@ class ElementorParser:
             responsive={"styles": canonical} if canonical else None,
         )
 
-        # Parse child elements
-        children = data.get("elements", [])
-        element.elements = [self._parse_element(child) for child in children]
-
-        return element
-
     def extract_content(self, doc: ElementorDocument) -> List[Dict[str, Any]]:
         """
         Extract all translatable content from an Elementor document.
@@ -232,45 +277,7 @@ class ElementorParser:
         Returns:
             List of content items with paths and values
         """
-        content_items = []
-
-        def extract_from_element(element: ElementorElement, path: str):
-            widget_info = self.WIDGET_TYPES.get(element.widget_type or "", {})
-            content_key = widget_info.get("content_key")
-
-            if content_key and content_key in element.settings:
-                value = element.settings[content_key]
-                if value:
-                    content_items.append({
-                        "path": f"{path}.settings.{content_key}",
-                        "key": content_key,
-                        "value": value,
-                        "widget_type": element.widget_type,
-                        "content_type": widget_info.get("type", "text"),
-                    })
-
-            # Also check common content keys in settings
-            for key in ["title", "description", "text", "content", "editor", "heading"]:
-                if key in element.settings and key != content_key:
-                    value = element.settings[key]
-                    if value and isinstance(value, str) and value.strip():
-                        content_items.append({
-                            "path": f"{path}.settings.{key}",
-                            "key": key,
-                            "value": value,
-                            "widget_type": element.widget_type,
-                            "content_type": "text",
-                        })
-
-            # Recurse into children
-            for i, child in enumerate(element.elements):
-                child_path = f"{path}.elements[{i}]"
-                extract_from_element(child, child_path)
-
-        for i, element in enumerate(doc.elements):
-            extract_from_element(element, f"elements[{i}]")
-
-        return content_items
+        return self._walk(doc, collect=True)[0]
 
     def analyze(self, doc: ElementorDocument) -> Dict[str, Any]:
         """
@@ -282,46 +289,92 @@ class ElementorParser:
         Returns:
             Dictionary with analysis results
         """
+        _, content_count, el_types, widget_types = self._walk(doc, collect=False)
+
         stats = {
-            "total_elements": 0,
-            "sections": 0,
-            "columns": 0,
-            "widgets": 0,
-            "widget_types": {},
-            "content_items": 0,
+            "total_elements": sum(el_types.values()),
+            "sections": el_types["section"],
+            "columns": el_types["column"],
+            "widgets": el_types["widget"],
+            "widget_types": dict(widget_types),
+            "content_items": content_count,
         }
 
-        def analyze_element(element: ElementorElement):
-            stats["total_elements"] += 1
-
-            if element.el_type == "section":
-                stats["sections"] += 1
-            elif element.el_type == "column":
-                stats["columns"] += 1
-            elif element.el_type == "widget":
-                stats["widgets"] += 1
-                wt = element.widget_type or "unknown"
-                stats["widget_types"][wt] = stats["widget_types"].get(wt, 0) + 1
-
-            for child in element.elements:
-                analyze_element(child)
-
-        for element in doc.elements:
-            analyze_element(element)
-
-        # Count content items
-        content = self.extract_content(doc)
-        stats["content_items"] = len(content)
-
         # Use Zone Theory analysis
-        raw_data = doc.to_dict()
-        zone_analysis = self.engine.analyze(raw_data.get("elements", []))
+        zone_analysis = self.engine.analyze([el.to_dict() for el in doc.elements])
 
         return {
             **stats,
             "zones": zone_analysis,
         }
 
+    def _walk(
+        self, doc: ElementorDocument, collect: bool
+    ) -> Tuple[List[Dict[str, Any]], int, Counter, Counter]:
+        """Count content items and element/widget types in one pass.
+
+        The content item dicts (and their paths) are only built when
+        ``collect`` is true; otherwise the returned list stays empty.
+        """
+        content_items: List[Dict[str, Any]] = []
+        append = content_items.append
+        content_count = 0
+        el_types: Counter = Counter()
+        widget_counts: Counter = Counter()
+        widget_types = self.WIDGET_TYPES
+
+        # Depth-first, in document order: children are pushed in reverse.
+        stack = [(element, f"elements[{i}]") for i, element in enumerate(doc.elements)]
+        stack.reverse()
+        while stack:
+            element, path = stack.pop()
+            settings = element.settings
+            widget_type = element.widget_type
+            el_type = element.el_type
+            el_types[el_type] += 1
+            if el_type == "widget":
+                widget_counts[widget_type or "unknown"] += 1
+
+            widget_info = widget_types.get(widget_type, _EMPTY_WIDGET_INFO)
+            content_key = widget_info.get("content_key")
+
+            if content_key and content_key in settings:
+                value = settings[content_key]
+                if value:
+                    content_count += 1
+                    if collect:
+                        append({
+                            "path": f"{path}.settings.{content_key}",
+                            "key": content_key,
+                            "value": value,
+                            "widget_type": widget_type,
+                            "content_type": widget_info.get("type", "text"),
+                        })
+
+            # Also check common content keys in settings
+            for key in _COMMON_CONTENT_KEYS:
+                if key in settings and key != content_key:
+                    value = settings[key]
+                    if value and isinstance(value, str) and value.strip():
+                        content_count += 1
+                        if collect:
+                            append({
+                                "path": f"{path}.settings.{key}",
+                                "key": key,
+                                "value": value,
+                                "widget_type": widget_type,
+                                "content_type": "text",
+                            })
+
+            children = element.elements
+            if collect:
+                for i in range(len(children) - 1, -1, -1):
+                    stack.append((children[i], f"{path}.elements[{i}]"))
+            else:
+                stack.extend((child, path) for child in reversed(children))
+
+        return content_items, content_count, el_types, widget_counts
+
     def to_json(self, doc: ElementorDocument, indent: int = 2) -> str:
         """Serialize document to JSON string."""
         return json.dumps(doc.to_dict(), indent=indent, ensure_ascii=False)
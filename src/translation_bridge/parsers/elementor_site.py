@@ -17,6 +17,7 @@ Elementor Export Kit structure:
 """
 
 import json
+import os
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -24,10 +25,40 @@ from typing import Any, Dict, List, Optional, Union
 import tempfile
 import shutil
 
-from .elementor import ElementorParser, ElementorDocument, ElementorElement
+from .._compat import DATACLASS_OPTIONS
+from .elementor import ElementorParser, ElementorDocument, ElementorElement, load_json
 
 
-@dataclass
+# Top-level entries of an export directory, keyed by name.
+_Entries = Dict[str, "os.DirEntry[str]"]
+
+
+def _list_entries(export_dir: Path) -> _Entries:
+    """List ``export_dir`` once so candidate files can be checked without a stat each."""
+    with os.scandir(export_dir) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+def _find_entry(export_dir: Path, entries: Optional[_Entries], name: str) -> Optional[Path]:
+    """Return the path of ``name`` in ``export_dir`` if it exists, else None.
+
+    Names match case-insensitively (an exact match wins), as ``Path.exists()``
+    does on macOS and Windows. Broken symlinks count as missing.
+    """
+    if entries is None:
+        entries = _list_entries(export_dir)
+    entry = entries.get(name)
+    if entry is None:
+        folded = name.casefold()
+        entry = next((e for n, e in entries.items() if n.casefold() == folded), None)
+        if entry is None:
+            return None
+    if entry.is_symlink() and not os.path.exists(entry.path):
+        return None
+    return export_dir / entry.name
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ElementorPage:
     """Represents a single page in the site export."""
 
@@ -52,7 +83,7 @@ class ElementorPage:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ElementorTemplate:
     """Represents a theme template (header, footer, etc.)."""
 
@@ -73,7 +104,7 @@ class ElementorTemplate:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GlobalColors:
     """Global color settings."""
 
@@ -99,7 +130,7 @@ class GlobalColors:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GlobalFonts:
     """Global typography settings."""
 
@@ -139,7 +170,7 @@ class GlobalFonts:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SiteSettings:
     """Global site settings."""
 
@@ -167,7 +198,7 @@ class SiteSettings:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ElementorSite:
     """Represents a complete Elementor site export."""
 
@@ -270,26 +301,34 @@ class ElementorSiteParser:
 
         site = ElementorSite()
 
+        # List the export root once; each step looks its candidate files and
+        # directories up in this listing instead of stat-ing each path.
+        entries = _list_entries(export_dir)
+
         # Parse site settings first (needed for global color/font resolution)
-        site.settings = self._parse_settings(export_dir)
+        site.settings = self._parse_settings(export_dir, entries)
 
         # Parse content (pages and posts)
-        site.pages = self._parse_content(export_dir)
+        site.pages = self._parse_content(export_dir, entries)
 
         # Parse templates
-        site.templates = self._parse_templates(export_dir)
+        site.templates = self._parse_templates(export_dir, entries)
 
         # Parse menus
-        site.menus = self._parse_menus(export_dir)
+        site.menus = self._parse_menus(export_dir, entries)
 
         # Collect asset references
-        site.assets = self._collect_assets(export_dir)
+        site.assets = self._collect_assets(export_dir, entries)
 
         return site
 
-    def _parse_settings(self, export_dir: Path) -> SiteSettings:
+    def _parse_settings(
+        self, export_dir: Path, entries: Optional[_Entries] = None
+    ) -> SiteSettings:
         """Parse site-settings.json for global settings."""
         settings = SiteSettings()
+        if entries is None:
+            entries = _list_entries(export_dir)
 
         # Try different possible file names
         settings_files = [
@@ -299,10 +338,9 @@ class ElementorSiteParser:
         ]
 
         for filename in settings_files:
-            settings_file = export_dir / filename
-            if settings_file.exists():
-                with open(settings_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            settings_file = _find_entry(export_dir, entries, filename)
+            if settings_file:
+                data = load_json(settings_file.read_bytes())
 
                 settings.site_name = data.get("blogname", data.get("site_name", ""))
                 settings.site_description = data.get("blogdescription", data.get("site_description", ""))
@@ -327,9 +365,13 @@ class ElementorSiteParser:
 
         return settings
 
-    def _parse_content(self, export_dir: Path) -> List[ElementorPage]:
+    def _parse_content(
+        self, export_dir: Path, entries: Optional[_Entries] = None
+    ) -> List[ElementorPage]:
         """Parse content.json for all pages and posts."""
         pages = []
+        if entries is None:
+            entries = _list_entries(export_dir)
 
         # Try different possible file names
         content_files = [
@@ -339,10 +381,9 @@ class ElementorSiteParser:
         ]
 
         for filename in content_files:
-            content_file = export_dir / filename
-            if content_file.exists():
-                with open(content_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            content_file = _find_entry(export_dir, entries, filename)
+            if content_file:
+                data = load_json(content_file.read_bytes())
 
                 # Handle different export formats
                 if isinstance(data, list):
@@ -360,11 +401,10 @@ class ElementorSiteParser:
                 break
 
         # Also check for individual page files
-        pages_dir = export_dir / "content"
-        if pages_dir.exists():
+        pages_dir = _find_entry(export_dir, entries, "content")
+        if pages_dir:
             for page_file in pages_dir.glob("*.json"):
-                with open(page_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_json(page_file.read_bytes())
                 page = self._parse_page_item(data)
                 if page:
                     pages.append(page)
@@ -389,7 +429,7 @@ class ElementorSiteParser:
         # Parse the Elementor data
         if isinstance(elementor_data, str):
             try:
-                elementor_data = json.loads(elementor_data)
+                elementor_data = load_json(elementor_data)
             except json.JSONDecodeError:
                 elementor_data = []
 
@@ -408,26 +448,28 @@ class ElementorSiteParser:
             meta=item.get("meta", {}),
         )
 
-    def _parse_templates(self, export_dir: Path) -> List[ElementorTemplate]:
+    def _parse_templates(
+        self, export_dir: Path, entries: Optional[_Entries] = None
+    ) -> List[ElementorTemplate]:
         """Parse theme builder templates."""
         templates = []
+        if entries is None:
+            entries = _list_entries(export_dir)
 
         # Check templates directory
-        templates_dir = export_dir / "templates"
-        if templates_dir.exists():
+        templates_dir = _find_entry(export_dir, entries, "templates")
+        if templates_dir:
             for template_file in templates_dir.glob("*.json"):
-                with open(template_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_json(template_file.read_bytes())
 
                 template = self._parse_template_item(data, template_file.stem)
                 if template:
                     templates.append(template)
 
         # Also check for theme-builder.json
-        theme_builder_file = export_dir / "theme-builder.json"
-        if theme_builder_file.exists():
-            with open(theme_builder_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        theme_builder_file = _find_entry(export_dir, entries, "theme-builder.json")
+        if theme_builder_file:
+            data = load_json(theme_builder_file.read_bytes())
 
             template_list = data if isinstance(data, list) else data.get("templates", [])
             for item in template_list:
@@ -452,7 +494,7 @@ class ElementorSiteParser:
 
         if isinstance(elementor_data, str):
             try:
-                elementor_data = json.loads(elementor_data)
+                elementor_data = load_json(elementor_data)
             except json.JSONDecodeError:
                 elementor_data = []
 
@@ -469,15 +511,16 @@ class ElementorSiteParser:
             document=document,
         )
 
-    def _parse_menus(self, export_dir: Path) -> Dict[str, List[Dict[str, Any]]]:
+    def _parse_menus(
+        self, export_dir: Path, entries: Optional[_Entries] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """Parse navigation menus."""
         menus = {}
 
         # Check for menus.json
-        menus_file = export_dir / "menus.json"
-        if menus_file.exists():
-            with open(menus_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        menus_file = _find_entry(export_dir, entries, "menus.json")
+        if menus_file:
+            data = load_json(menus_file.read_bytes())
 
             if isinstance(data, dict):
                 for menu_name, menu_items in data.items():
@@ -487,13 +530,18 @@ class ElementorSiteParser:
 
         return menus
 
-    def _collect_assets(self, export_dir: Path) -> Dict[str, str]:
+    def _collect_assets(
+        self, export_dir: Path, entries: Optional[_Entries] = None
+    ) -> Dict[str, str]:
         """Collect asset references from the export."""
         assets = {}
+        if entries is None:
+            entries = _list_entries(export_dir)
 
         # Check wp-content/uploads
-        uploads_dir = export_dir / "wp-content" / "uploads"
-        if uploads_dir.exists():
+        wp_content_dir = _find_entry(export_dir, entries, "wp-content")
+        uploads_dir = wp_content_dir / "uploads" if wp_content_dir else None
+        if uploads_dir and uploads_dir.exists():
             for asset_file in uploads_dir.rglob("*"):
                 if asset_file.is_file():
                     relative_path = asset_file.relative_to(export_dir)
@@ -501,8 +549,8 @@ class ElementorSiteParser:
                     assets[str(relative_path)] = str(asset_file)
 
         # Also check assets directory
-        assets_dir = export_dir / "assets"
-        if assets_dir.exists():
+        assets_dir = _find_entry(export_dir, entries, "assets")
+        if assets_dir:
             for asset_file in assets_dir.rglob("*"):
                 if asset_file.is_file():
                     relative_path = asset_file.relative_to(export_dir)
@@ -258,8 +258,8 @@ def bootstrap_to_elementor(data: Any) -> Any:
 )
 def elementor_to_gutenberg(data: Any) -> str:
     """Transform Elementor JSON to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -271,8 +271,8 @@ def elementor_to_gutenberg(data: Any) -> str:
 )
 def html_to_gutenberg(data: Any) -> str:
     """Transform generic HTML to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -284,8 +284,8 @@ def html_to_gutenberg(data: Any) -> str:
 )
 def divi_to_gutenberg(data: Any) -> str:
     """Transform Divi data to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -297,8 +297,8 @@ def divi_to_gutenberg(data: Any) -> str:
 )
 def bricks_to_gutenberg(data: Any) -> str:
     """Transform Bricks JSON to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -323,8 +323,8 @@ def bricks_to_bootstrap(data: Any) -> str:
 )
 def oxygen_to_gutenberg(data: Any) -> str:
     """Transform parsed classic Oxygen content to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -349,8 +349,8 @@ def oxygen_to_bootstrap(data: Any) -> str:
 )
 def elementor4_to_gutenberg(data: Any) -> str:
     """Transform parsed Elementor 4 Atomic content to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -375,8 +375,8 @@ def elementor4_to_bootstrap(data: Any) -> str:
 )
 def oxygen6_to_gutenberg(data: Any) -> str:
     """Transform parsed Oxygen 6 content to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -401,8 +401,8 @@ def oxygen6_to_bootstrap(data: Any) -> str:
 )
 def divi5_to_gutenberg(data: Any) -> str:
     """Transform parsed DIVI 5 content to Gutenberg block markup."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -466,8 +466,8 @@ def gutenberg_to_bricks(data: Any) -> str:
 )
 def wpbakery_to_gutenberg(data: Any) -> str:
     """Transform parsed wpbakery content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -492,8 +492,8 @@ def wpbakery_to_bootstrap(data: Any) -> str:
 )
 def avada_to_gutenberg(data: Any) -> str:
     """Transform parsed avada content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -518,8 +518,8 @@ def avada_to_bootstrap(data: Any) -> str:
 )
 def kadence_to_gutenberg(data: Any) -> str:
     """Transform parsed kadence content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -544,8 +544,8 @@ def kadence_to_bootstrap(data: Any) -> str:
 )
 def beaver_builder_to_gutenberg(data: Any) -> str:
     """Transform parsed beaver-builder content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -570,8 +570,8 @@ def beaver_builder_to_bootstrap(data: Any) -> str:
 )
 def thrive_to_gutenberg(data: Any) -> str:
     """Transform parsed thrive content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
@@ -596,8 +596,8 @@ def thrive_to_bootstrap(data: Any) -> str:
 )
 def bootstrap_to_gutenberg(data: Any) -> str:
     """Transform parsed bootstrap content to gutenberg."""
-    from ..converters.gutenberg import GutenbergConverter
-    return GutenbergConverter().convert(data)
+    from ..converters.gutenberg import gutenberg_converter
+    return gutenberg_converter.convert(data)
 
 
 @TransformRegistry.register(
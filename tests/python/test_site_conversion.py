@@ -9,11 +9,15 @@ Tests cover:
 - Multi-page site conversion workflows
 """
 
+import copy
 import json
 import pytest
+import re
 import sys
 import tempfile
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
@@ -33,7 +37,15 @@ from translation_bridge.converters.divi5 import Divi5Converter
 from translation_bridge.converters.elementor4 import Elementor4Converter
 from translation_bridge.converters.styles import StylesConverter
 from translation_bridge.converters.templates import TemplateConverter, TemplatePartGenerator
-from translation_bridge.parsers.elementor_site import ElementorSiteParser
+from translation_bridge.parsers.elementor import ElementorDocument
+from translation_bridge.parsers.elementor_site import (
+    ElementorPage,
+    ElementorSite,
+    ElementorSiteParser,
+    ElementorTemplate,
+    GlobalColors,
+    GlobalFonts,
+)
 
 
 # =============================================================================
@@ -233,6 +245,33 @@ class TestElementorConverter:
         collect_ids(result)
         assert len(ids) == len(set(ids))  # All IDs unique
 
+    def test_top_level_containers_pass_through(self):
+        """Should keep flexbox containers as layout roots, not wrap them as widgets."""
+        container = {"id": "c1", "elType": "container", "settings": {}, "elements": []}
+        result = ElementorConverter().convert_to_dict([copy.deepcopy(container)])
+        assert result == [container]
+        assert result[0]["elType"] == "container"
+
+    def test_reexported_sections_get_missing_ids(self):
+        """Should keep Elementor sections as-is but fill in missing IDs."""
+        section = {
+            "elType": "section",
+            "settings": {},
+            "elements": [{"elType": "column", "settings": {}, "elements": []}],
+        }
+        result = ElementorConverter().convert_to_dict([section])
+        assert len(result) == 1
+        assert result[0]["elType"] == "section"
+        assert result[0]["id"]
+        assert result[0]["elements"][0]["id"]
+
+    def test_convert_writes_unicode_unescaped(self):
+        """Should emit non-ASCII text as UTF-8 rather than \\u escapes."""
+        converter = ElementorConverter()
+        result = converter.convert({"type": "heading", "content": "Café © 2024"})
+        assert "Café © 2024" in result
+        assert json.loads(result)[0]["elements"][0]["elements"][0]["settings"]["title"] == "Café © 2024"
+
     def test_get_framework(self):
         """Should return correct framework name."""
         converter = ElementorConverter()
@@ -277,6 +316,22 @@ class TestDiviConverter:
         assert "[/et_pb_row]" in result
         assert "[/et_pb_section]" in result
 
+    def test_text_orientation_prefers_explicit_setting(self):
+        """Should keep an explicit text_orientation over a generic align."""
+        converter = DiviConverter()
+        result = converter._build_text_module({"text_orientation": "right", "align": "left"}, "x")
+        assert 'text_orientation="right"' in result
+        assert 'text_orientation="left"' not in result
+
+    @pytest.mark.parametrize(
+        "size,expected",
+        [(10, "4_4"), (25, "1_4"), (33, "1_3"), (50, "1_2"), (66, "2_3"), (75, "3_4"), (100, "4_4")],
+    )
+    def test_column_size_maps_to_divi_type(self, size, expected):
+        """Should map column widths onto the nearest DIVI column type."""
+        converter = DiviConverter()
+        assert converter._size_to_divi_column(size) == expected
+
     def test_get_framework(self):
         """Should return correct framework name."""
         converter = DiviConverter()
@@ -597,6 +652,77 @@ class TestGutenbergConverter:
         assert "<!-- wp:paragraph" in out
         assert "Hello world." in out
 
+    def test_block_attrs_cache_keeps_bool_and_int_distinct(self):
+        converter = GutenbergConverter()
+        assert '{"a":1}' in converter._build_block("core/x", {"a": 1}, "")
+        assert '{"a":true}' in converter._build_block("core/x", {"a": True}, "")
+        assert '{"a":1}' in converter._build_block("core/x", {"a": 1}, "")
+
+    def test_list_items_escape_independently(self):
+        converter = GutenbergConverter()
+        out = converter._build_list_block(
+            {"icon_list": [{"text": "a & b"}, {"text": "x\x00<y>"}, {"text": ""}]}
+        )
+        assert "<li>a &amp; b</li>" in out
+        assert "<li>x\x00&lt;y&gt;</li>" in out
+        assert "<li></li>" in out
+
+    def test_dict_subclass_input_converts_like_plain_dicts(self, sample_elementor_data):
+        """OrderedDict or other dict-subclass trees should convert in full."""
+        def ordered(value):
+            if isinstance(value, dict):
+                return OrderedDict((k, ordered(v)) for k, v in value.items())
+            if isinstance(value, list):
+                return [ordered(v) for v in value]
+            return value
+
+        converter = GutenbergConverter()
+        expected = converter.convert(sample_elementor_data)
+        assert expected
+        assert GutenbergConverter().convert(ordered(sample_elementor_data)) == expected
+
+    def test_every_simple_widget_has_a_builder(self):
+        converter = GutenbergConverter()
+        assert set(converter.SIMPLE_WIDGET_BUILDERS) == set(converter.SIMPLE_BLOCK_FOR_WIDGET)
+
+    def test_gallery_ids_are_deduplicated_in_order(self):
+        """Repeated attachments drop their figure too; ID-less images all stay."""
+        converter = GutenbergConverter()
+        out = converter._build_gallery_block({"gallery": [
+            {"id": 3, "url": "a"}, {"id": 1, "url": "b"}, {"id": 3, "url": "c"},
+            {"url": "d"}, {"url": "d"},
+        ]})
+        assert '"ids":[3,1]' in out
+        assert re.findall(r'<img src="([^"]*)"', out) == ["a", "b", "d", "d"]
+
+    def test_widget_cache_keeps_bool_and_int_distinct(self):
+        converter = GutenbergConverter()
+
+        def spacer(value):
+            return converter.convert(
+                {"elType": "widget", "widgetType": "spacer", "settings": {"space": value}}
+            )
+
+        assert spacer(1) == spacer(1)
+        assert spacer(1) != spacer(True)
+        assert len(converter._widget_cache) == 2
+
+    def test_shared_converter_is_safe_across_threads(self):
+        """Threads sharing one converter should not race on the widget cache."""
+        converter = GutenbergConverter()
+        pages = [
+            [{"elType": "widget", "widgetType": "spacer", "settings": {"space": n % 700}}]
+            for n in range(2000)
+        ]
+        expected = [GutenbergConverter().convert(page) for page in pages]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(converter.convert, pages)) == expected
+
+    def test_every_compound_widget_has_a_builder(self):
+        converter = GutenbergConverter()
+        assert set(converter.COMPOUND_WIDGET_BUILDERS) == converter.COMPOUND_WIDGETS
+
     def test_get_supported_widgets_includes_new_set(self):
         converter = GutenbergConverter()
         widgets = converter.get_supported_widgets()
@@ -730,6 +856,12 @@ class TestWPBakeryConverter:
         assert "[/vc_column]" in result
         assert "[/vc_row]" in result
 
+    def test_every_mapped_element_has_a_builder(self):
+        """Each WPBakery element in ELEMENT_TYPE_MAP dispatches to a builder."""
+        converter = WPBakeryConverter()
+        builders = set(converter.ELEMENT_BUILDERS) | set(converter.CONTENT_ELEMENT_BUILDERS)
+        assert set(converter.ELEMENT_TYPE_MAP.values()) - builders == {"vc_counter"}
+
     def test_get_framework(self):
         """Should return correct framework name."""
         converter = WPBakeryConverter()
@@ -884,6 +1016,43 @@ class TestOxygenConverter:
         for element in result["children"]:
             walk(element)
 
+    def test_gallery_drops_repeated_image_ids(self):
+        """Repeated attachments keep their first occurrence; ID-less images all stay."""
+        options = OxygenConverter()._gallery_options(
+            {"gallery": [{"id": 7, "url": "a"}, {"url": "b"}, {"id": 7, "url": "c"}, {"url": "b"}]},
+            "",
+        )
+        assert [img["url"] for img in options["images"]] == ["a", "b", "b"]
+
+    def test_deep_nesting_converts_without_recursion(self):
+        """Nesting deeper than the recursion limit should still convert."""
+        depth = sys.getrecursionlimit() + 100
+        data = {"elType": "container", "elements": []}
+        leaf = data
+        for _ in range(depth):
+            child = {"elType": "container", "elements": []}
+            leaf["elements"].append(child)
+            leaf = child
+
+        node = OxygenConverter().convert_to_dict([data])["children"][0]
+        for expected_id in range(1, depth + 2):
+            assert node["id"] == expected_id
+            node = node["children"][0] if node["children"] else None
+        assert node is None
+
+    def test_dict_subclass_input_converts_like_plain_dicts(self, sample_elementor_data):
+        """OrderedDict element trees should produce the same Oxygen tree."""
+        def ordered(value):
+            if isinstance(value, dict):
+                return OrderedDict((k, ordered(v)) for k, v in value.items())
+            if isinstance(value, list):
+                return [ordered(v) for v in value]
+            return value
+
+        expected = OxygenConverter().convert_to_dict(sample_elementor_data)
+        assert expected["children"]
+        assert OxygenConverter().convert_to_dict(ordered(sample_elementor_data)) == expected
+
     def test_get_framework(self):
         """Should return correct framework name."""
         converter = OxygenConverter()
@@ -1140,6 +1309,131 @@ class TestStylesConverter:
         css = converter.to_css(tokens)
         assert "--spacing" in css
 
+    def test_token_slugs_fold_spaces_and_underscores(self):
+        """Color/font slugs fold spaces and underscores; spacing keeps underscores."""
+        converter = StylesConverter()
+        tokens = converter.extract_tokens({
+            "system_colors": {"c": {"title": "Brand Main_Color", "color": "#fff"}},
+            "spacing": {"Gap_Large": {"size": 8, "unit": "px"}},
+        })
+        assert tokens.colors[0].slug == "brand-main-color"
+        assert tokens.spacing[0].slug == "gap_large"
+        assert ".bg-brand-main-color { background-color: var(--color-brand-main-color); }" in (
+            converter.to_css(tokens)
+        )
+
+    def test_token_slugs_follow_name_edits(self):
+        """Renaming a token in place should rename its CSS variable."""
+        converter = StylesConverter()
+        tokens = converter.extract_tokens({
+            "system_colors": {"c": {"title": "Primary", "color": "#f00"}},
+        })
+        assert "--color-primary: #f00;" in converter.to_css(tokens)
+        tokens.colors[0].name = "Brand Red"
+        css = converter.to_css(tokens)
+        assert "--color-brand-red: #f00;" in css
+        assert "--color-primary" not in css
+
+    def test_tailwind_config_is_json_object(self, sample_site_settings):
+        """Tailwind config body should be a JSON object with quoted values."""
+        import json
+
+        converter = StylesConverter()
+        tokens = converter.extract_tokens(sample_site_settings)
+        tokens.fonts[0].family = "O'Brien Sans"
+        config = converter.to_tailwind_config(tokens)
+
+        assert config.startswith("module.exports = ") and config.endswith(";")
+        extend = json.loads(config[len("module.exports = "):-1])["theme"]["extend"]
+        assert extend["colors"]["primary"] == "#e94560"
+        assert extend["fontFamily"]["primary"] == ["O'Brien Sans", "sans-serif"]
+        assert extend["maxWidth"] == {"container": "1140px"}
+
+        tokens.fonts[0].family = "Montserrat Éditée"
+        assert '"Montserrat Éditée"' in converter.to_tailwind_config(tokens)
+
+    def test_color_category_follows_priority_order(self):
+        """Keys naming several categories resolve by priority, not position."""
+        converter = StylesConverter()
+        assert converter._categorize_color("accent_primary") == "primary"
+        assert converter._categorize_color("Body-Secondary") == "secondary"
+        assert converter._categorize_color("accent_text") == "text"
+        assert converter._categorize_color("e_global_color_1") == "primary"
+
+    def test_css_omits_sections_without_tokens(self):
+        """Empty token lists should not leave empty section headers."""
+        converter = StylesConverter()
+        css = converter.to_css(converter.extract_tokens({"spacing": {"sm": "8"}}))
+
+        assert "/* Colors */" not in css
+        assert "/* Typography utility classes */" not in css
+        assert "--spacing-sm: 8px;" in css
+        assert "--container-width: 1140px;" in css
+
+    def test_iter_css_streams_to_css_output(self, sample_site_settings):
+        """Joined iter_css chunks should equal to_css output."""
+        converter = StylesConverter()
+        tokens = converter.extract_tokens(sample_site_settings)
+        tokens.custom_css = ".hero { color: red; }"
+        chunks = list(converter.iter_css(tokens))
+
+        assert len(chunks) > 1
+        assert all(chunk.endswith("\n") for chunk in chunks)
+        assert "".join(chunks) == converter.to_css(tokens)
+
+    def test_google_fonts_import_requests_each_family_once(self):
+        """Tokens sharing a family and weight should not repeat in the URL."""
+        from translation_bridge.converters.styles import FontToken
+
+        converter = StylesConverter()
+        fonts = [
+            FontToken(id="h", name="Heading", family="Open Sans", weight="700"),
+            FontToken(id="s", name="Subheading", family="Open Sans", weight="700"),
+            FontToken(id="b", name="Body", family="Open Sans", weight="400"),
+        ]
+        url = converter._generate_google_fonts_import(fonts)
+        assert url.count("family=") == 2
+        assert "family=Open+Sans:wght@700&family=Open+Sans:wght@400&" in url
+
+    def test_output_cache_tracks_token_changes(self, sample_site_settings):
+        """Identical token sets reuse output; edited tokens re-render."""
+        first = StylesConverter()
+        css = first.to_css(first.extract_tokens(sample_site_settings))
+        second = StylesConverter()
+        tokens = second.extract_tokens(sample_site_settings)
+        assert second.to_css(tokens) is css
+
+        tokens.colors[0].value = "#abcdef"
+        assert "--color-primary: #abcdef;" in second.to_css(tokens)
+        assert "--color-primary: #e94560;" in css
+
+    def test_output_cache_keeps_equal_values_of_different_types_apart(self):
+        """1140.0 and 1140 hash alike but must not share cached output."""
+        as_float = StylesConverter()
+        as_float.to_bootstrap_overrides(as_float.extract_tokens({"container_width": {"size": 1140.0}}))
+        as_int = StylesConverter()
+        scss = as_int.to_bootstrap_overrides(as_int.extract_tokens({"container_width": {"size": 1140}}))
+        assert "xl: 1140px" in scss
+
+    def test_token_lookup_by_id_tracks_edits(self, sample_site_settings):
+        """ID lookups return the first match and follow later token edits."""
+        from translation_bridge.converters.styles import ColorToken
+
+        tokens = StylesConverter().extract_tokens(sample_site_settings)
+        assert tokens.get_color_by_id("accent").value == "#0f3460"
+        assert tokens.get_color_by_id("late") is None
+        tokens.colors.append(ColorToken(id="late", name="Late", value="#111"))
+        tokens.colors.append(ColorToken(id="accent", name="Dup", value="#222"))
+        assert tokens.get_color_by_id("late").value == "#111"
+        assert tokens.get_color_by_id("accent").value == "#0f3460"
+        assert tokens.get_font_by_id("secondary").family == "Open Sans"
+
+        tokens.colors[0] = ColorToken(id="replaced", name="Replaced", value="#333")
+        assert tokens.get_color_by_id("replaced").value == "#333"
+        assert tokens.get_color_by_id("primary") is None
+        tokens.colors[0].id = "renamed"
+        assert tokens.get_color_by_id("renamed").value == "#333"
+
     def test_empty_settings(self):
         """Should handle empty settings gracefully."""
         converter = StylesConverter()
@@ -1198,6 +1492,41 @@ class TestTemplateConverter:
         # Dynamic placeholders should be in output
         assert "{{" in result or "{%" in result or "site" in result.lower()
 
+    def test_dynamic_widgets_recorded_in_document_order(self):
+        """Dynamic widgets are found during conversion, in document order."""
+        data = {"content": [{"id": "s", "elType": "section", "settings": {}, "elements": [{
+            "id": "c", "elType": "column", "settings": {}, "elements": [
+                {"id": "l", "elType": "widget", "widgetType": "theme-site-logo", "settings": {}},
+                {"id": "f", "elType": "widget", "widgetType": "search-form", "settings": {}},
+            ],
+        }]}]}
+
+        converter = TemplateConverter()
+        html = converter.convert_header(data)
+        assert list(converter.dynamic_placeholders) == ["site_logo", "search_form"]
+        assert "<!-- DYNAMIC: site_logo -->" in html
+
+    def test_placeholder_markers_replaced_by_name(self):
+        """Known placeholder markers are replaced; unknown ones are kept."""
+        from translation_bridge.converters.templates import TemplatePartConfig
+
+        converter = TemplateConverter(TemplatePartConfig(format="jinja2"))
+        converter.convert_header([{
+            "id": "s", "elType": "section", "settings": {}, "elements": [{
+                "id": "c", "elType": "column", "settings": {}, "elements": [
+                    {"id": "n1", "elType": "widget", "widgetType": "nav-menu", "settings": {}},
+                    {"id": "n2", "elType": "widget", "widgetType": "mega-menu", "settings": {}},
+                ],
+            }],
+        }])
+        assert list(converter.dynamic_placeholders) == ["nav_menu"]
+        assert converter.dynamic_placeholders["nav_menu"].elementor_type == "nav-menu"
+        html = converter._postprocess_placeholders(
+            "<!-- PLACEHOLDER: nav_menu --> <!-- PLACEHOLDER: year -->",
+            converter.dynamic_placeholders,
+        )
+        assert html == "{{ nav_menu }} <!-- PLACEHOLDER: year -->"
+
 
 class TestTemplatePartGenerator:
     """Test TemplatePartGenerator class."""
@@ -1211,6 +1540,21 @@ class TestTemplatePartGenerator:
         assert isinstance(parts, dict)
         assert "header.html" in parts or "README.md" in parts
 
+    def test_generate_all_streams_to_writer(self, sample_header_template):
+        """A writer receives each part in order and nothing is retained."""
+        templates = [
+            {"type": "header", "document": sample_header_template},
+            {"type": "footer", "document": sample_header_template},
+        ]
+        expected = TemplatePartGenerator().generate_all(templates)
+
+        written = []
+        parts = TemplatePartGenerator().generate_all(
+            templates, writer=lambda name, content: written.append((name, content))
+        )
+        assert parts == {}
+        assert written == list(expected.items())
+
     def test_generate_with_format(self, sample_header_template):
         """Should generate with specified format."""
         generator = TemplatePartGenerator(output_format="jinja2")
@@ -1243,6 +1587,65 @@ class TestElementorSiteParser:
         assert hasattr(parser, "analyze")
         assert callable(parser.analyze)
 
+    def test_parse_directory_matches_names_case_insensitively(self, tmp_path):
+        """Export files should be found regardless of case; broken links are skipped."""
+        (tmp_path / "Site-Settings.json").write_text(json.dumps({"blogname": "Cased"}))
+        (tmp_path / "Templates").mkdir()
+        (tmp_path / "Templates" / "header.json").write_text(
+            json.dumps({"id": "h", "content": [{"elType": "section", "id": "s"}]})
+        )
+        try:
+            (tmp_path / "menus.json").symlink_to(tmp_path / "missing.json")
+        except OSError:
+            pass
+
+        site = ElementorSiteParser().parse_directory(str(tmp_path))
+        assert site.settings.site_name == "Cased"
+        assert site.get_header() is not None
+        assert site.menus == {}
+
+    def test_global_lookups_track_setting_changes(self, sample_site_settings):
+        """ID lookups should follow added, edited and replaced entries."""
+        colors = GlobalColors(colors=dict(sample_site_settings["system_colors"]))
+        fonts = GlobalFonts(fonts=sample_site_settings["system_typography"])
+        assert colors.get_color("accent") == "#0f3460"
+        assert colors.get_color("late") is None
+        assert fonts.get_font_family("secondary") == "Open Sans"
+
+        colors.colors["late"] = {"_id": "late", "color": "#111"}
+        assert colors.get_color("late") == "#111"
+
+        colors.colors["late"]["color"] = "#222"
+        assert colors.get_color("late") == "#222"
+
+        colors.colors["primary"] = {"_id": "q", "color": "#333"}
+        assert colors.get_color("q") == "#333"
+        assert colors.get_color("primary") is None
+
+    def test_site_lookups_track_list_edits(self):
+        """Page and template lookups should follow added, replaced and edited items."""
+        def page(slug, title):
+            return ElementorPage(id=0, title=title, slug=slug, post_type="page",
+                                 status="publish", document=ElementorDocument(elements=[]))
+
+        site = ElementorSite(pages=[page("home", "First"), page("home", "Second")])
+        assert site.get_page_by_slug("home").title == "First"
+        assert site.get_page_by_slug("about") is None
+        assert site.get_header() is None
+
+        site.pages.append(page("about", "About"))
+        site.templates.append(ElementorTemplate(id="1", type="header", title="Header",
+                                                conditions=[], document=ElementorDocument(elements=[])))
+        assert site.get_page_by_slug("about").title == "About"
+        assert site.get_header().title == "Header"
+
+        site.templates[0] = ElementorTemplate(id="2", type="header", title="New Header",
+                                              conditions=[], document=ElementorDocument(elements=[]))
+        assert site.get_header().title == "New Header"
+        site.templates[0].type = "footer"
+        assert site.get_header() is None
+        assert site.get_footer().title == "New Header"
+
 
 # =============================================================================
 # Cross-Framework Conversion Tests
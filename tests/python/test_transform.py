@@ -32,6 +32,7 @@ from translation_bridge.parsers.elementor import (
     ElementorParser,
     ElementorDocument,
     ElementorElement,
+    load_json,
 )
 
 
@@ -315,6 +316,28 @@ class TestElementorParser:
         assert column.el_type == "column"
         assert len(column.elements) == 3  # Three widgets
 
+    def test_parse_deeply_nested_elements(self, elementor_parser):
+        """Nesting deeper than the recursion limit should parse and serialize."""
+        depth = sys.getrecursionlimit() + 100
+        root = node = {"id": "0", "elType": "section", "elements": []}
+        for i in range(1, depth):
+            child = {"id": str(i), "elType": "column", "elements": []}
+            node["elements"].append(child)
+            node = child
+
+        doc = elementor_parser.parse([root])
+        element, levels = doc.elements[0], 1
+        while element.elements:
+            element = element.elements[0]
+            levels += 1
+        assert levels == depth
+        assert element.id == str(depth - 1)
+
+        data = doc.to_dict()["elements"][0]
+        for _ in range(depth - 1):
+            data = data["elements"][0]
+        assert data == {"id": str(depth - 1), "elType": "column", "settings": {}, "elements": []}
+
     def test_extract_content(self, elementor_parser, sample_elementor_data):
         """Should extract content from parsed document."""
         doc = elementor_parser.parse(sample_elementor_data)
@@ -338,6 +361,14 @@ class TestElementorParser:
         assert "text-editor" in stats["widget_types"]
         assert "button" in stats["widget_types"]
 
+    def test_load_json_matches_stdlib(self):
+        """load_json should decode exactly like json.loads, fast path or not."""
+        raw = '{"n": 123456789012345678901234567890, "f": NaN, "s": "\u00fc"}'
+        assert json.dumps(load_json(raw)) == json.dumps(json.loads(raw))
+        assert load_json(raw.encode("utf-8"))["s"] == "\u00fc"
+        with pytest.raises(json.JSONDecodeError):
+            load_json("{not json")
+
     def test_to_json(self, elementor_parser, sample_elementor_data):
         """Should serialize document to JSON."""
         doc = elementor_parser.parse(sample_elementor_data)